@@ -0,0 +1,200 @@
+"""
+[V16.20] Scout 오프라인 벤치마크 (record / replay)
+
+1) 녹화 (실제 네트워크, 1회):
+   python bench_scout.py record
+2) 재생 벤치마크 (네트워크 미사용, 호스트별 지연 시뮬레이션):
+   python bench_scout.py --default-latency 0.05 --latency search.naver.com=0.15
+3) 회귀 게이트:
+   python bench_scout.py --save-baseline bench_baseline.json
+   python bench_scout.py --baseline bench_baseline.json --tolerance 0.25   # 느려지면 exit 1
+4) HTML 파서 백엔드 비교 (녹화된 네이버 페이지):
+   python bench_scout.py parsers --repeat 20
+"""
+import argparse
+import base64
+import json
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+from engines import health, parsing
+from engines.profiler import profiler
+from engines.replay import Recorder, Replayer
+
+FIXTURE_PATH = "fixtures/scout.jsonl"
+
+
+# 파서 벤치마크 대상 페이지: {추출 종류: 녹화 키 접두어}
+PARSER_PAGES = {
+    "news_search": "GET search.naver.com/search.naver",
+    "sise_deposit": "GET finance.naver.com/sise/sise_deposit",
+}
+
+
+class ParseTimer:
+    """파싱 시간 누적 (모든 스레드 합산, profiler의 parse span 기준 - 백엔드/프로세스 풀과 무관)"""
+    def __enter__(self):
+        profiler.reset()
+        self.seconds = 0.0
+        self.count = 0
+        return self
+
+    def __exit__(self, *exc):
+        spans = [s for s in profiler.spans if s["kind"] == "parse"]
+        self.seconds = sum(s["duration"] for s in spans)
+        self.count = len(spans)
+        return False
+
+
+def _fresh_scout(workers):
+    # 로컬 캐시/시계열 저장소를 매번 비운 상태로 측정 (cold run)
+    config.CACHE_DIR = tempfile.mkdtemp(prefix="scout-bench-")
+    # 재생 누락(ConnectionError)으로 열린 차단기가 다음 측정에 이어지지 않도록 소스 상태도 초기화
+    health.reset_registry()
+    from engines.scout import Scout
+    return Scout(max_workers=workers)
+
+
+def missions(workers):
+    """벤치마크 대상: {이름: Scout -> 호출} (workers=1 이면 병렬/순차 항목이 하나로 합쳐짐)"""
+    return dict([
+        (f"collect_data[workers={workers}]", lambda s: s.collect_data(config.SECTORS, config.MACRO_TICKERS)),
+        ("collect_data[workers=1]", lambda s: s.collect_data(config.SECTORS, config.MACRO_TICKERS)),
+        ("get_risk_indices", lambda s: s.get_risk_indices()),
+        ("calculate_pulse_score", lambda s: s.calculate_pulse_score()),
+        ("get_korea_market_index", lambda s: s.get_korea_market_index()),
+        ("get_macro_data", lambda s: s.get_macro_data(config.MACRO_TICKERS)),
+        ("get_players_data", lambda s: s.get_players_data()),
+        ("get_policy_news", lambda s: s.get_policy_news()),
+        ("get_micro_data", lambda s: s.get_micro_data(config.SECTORS)),
+    ])
+
+
+def run_benchmark(replayer, workers):
+    results = {}
+    for name, call in missions(workers).items():
+        scout = _fresh_scout(1 if name.endswith("[workers=1]") else workers)
+        replayer.reset_stats()
+        with ParseTimer() as parse:
+            start = time.perf_counter()
+            call(scout)
+            wall = time.perf_counter() - start
+        results[name] = {"wall": round(wall, 4), **replayer.totals(),
+                         "parse": round(parse.seconds, 4), "parses": parse.count}
+    return results
+
+
+def print_table(results):
+    print(f"\n{'mission':<32}{'wall(s)':>10}{'reqs':>7}{'miss':>6}{'KB':>10}{'parse(s)':>10}")
+    for name, r in results.items():
+        print(f"{name:<32}{r['wall']:>10.3f}{r['requests']:>7}{r['misses']:>6}{r['bytes'] / 1024:>10.1f}{r['parse']:>10.3f}")
+
+
+def check_baseline(results, baseline, tolerance):
+    """기준 대비 wall time 이 (1 + tolerance)배를 넘은 임무 목록"""
+    regressions = []
+    for name, r in results.items():
+        base = baseline.get(name)
+        if base and r["wall"] > base["wall"] * (1 + tolerance):
+            regressions.append(f"{name}: {base['wall']:.3f}s -> {r['wall']:.3f}s")
+    return regressions
+
+
+def load_pages(path):
+    """녹화 fixture에서 파서 벤치마크용 HTML 페이지 {종류: [html, ...]}"""
+    pages = {kind: [] for kind in PARSER_PAGES}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            for kind, prefix in PARSER_PAGES.items():
+                if record["key"].startswith(prefix) and record["status"] == 200:
+                    pages[kind].append(base64.b64decode(record["body"]).decode("utf-8", errors="replace"))
+    return pages
+
+
+def run_parser_benchmark(pages, repeat, workers):
+    """
+    백엔드별 파싱 시간 (페이지 x repeat) + 기준(html.parser 전체 DOM)과 결과 일치 여부
+    - workers개 스레드로 동시에 파싱 (수집 중 여러 페이지가 겹치는 상황)
+    - HTML_PROCESS_WORKERS > 0 이면 프로세스 풀 경유 항목도 측정
+    """
+    jobs = [(kind, html) for kind, htmls in pages.items() for html in htmls] * repeat
+    reference = {(kind, html): parsing.EXTRACTORS[kind]["html.parser.full"](html) for kind, html in set(jobs)}
+    variants = [(backend, 0) for backend in parsing.available_backends()]
+    if config.HTML_PROCESS_WORKERS > 0:
+        variants.append((parsing.default_backend(), config.HTML_PROCESS_WORKERS))
+
+    results = {}
+    process_workers = config.HTML_PROCESS_WORKERS
+    try:
+        for backend, processes in variants:
+            config.HTML_PROCESS_WORKERS = processes
+            name = f"{backend}+processes={processes}" if processes else backend
+            if processes:
+                parsing.extract(*jobs[0], backend=backend) # 프로세스 기동은 측정에서 제외
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                start = time.perf_counter()
+                outputs = list(pool.map(lambda job: parsing.extract(job[0], job[1], backend=backend), jobs))
+                wall = time.perf_counter() - start
+            mismatches = sum(out != reference[job] for job, out in zip(jobs, outputs))
+            results[name] = {"wall": round(wall, 4), "pages": len(jobs), "mismatches": mismatches}
+    finally:
+        config.HTML_PROCESS_WORKERS = process_workers
+    return results
+
+
+def parse_latency(text):
+    latency = {}
+    for item in filter(None, (text or "").split(",")):
+        host, seconds = item.split("=")
+        latency[host.strip()] = float(seconds)
+    return latency
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scout record/replay benchmark")
+    parser.add_argument("mode", nargs="?", choices=["record", "replay", "parsers"], default="replay")
+    parser.add_argument("--fixtures", default=FIXTURE_PATH)
+    parser.add_argument("--workers", type=int, default=config.SCOUT_MAX_WORKERS)
+    parser.add_argument("--latency", help="호스트별 지연(초): host=0.1,host2=0.2")
+    parser.add_argument("--default-latency", type=float, default=0.05)
+    parser.add_argument("--baseline")
+    parser.add_argument("--save-baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--repeat", type=int, default=10, help="parsers 모드: 페이지당 반복 횟수")
+    args = parser.parse_args()
+
+    if args.mode == "parsers":
+        pages = load_pages(args.fixtures)
+        print("📄 " + ", ".join(f"{kind}: {len(htmls)} pages" for kind, htmls in pages.items()))
+        print(f"\n{'backend':<28}{'wall(s)':>10}{'pages':>8}{'ms/page':>10}{'mismatch':>10}")
+        for name, r in run_parser_benchmark(pages, args.repeat, args.workers).items():
+            print(f"{name:<28}{r['wall']:>10.3f}{r['pages']:>8}{r['wall'] * 1000 / max(r['pages'], 1):>10.2f}{r['mismatches']:>10}")
+        sys.exit(0)
+
+    if args.mode == "record":
+        with Recorder(args.fixtures) as recorder:
+            _fresh_scout(1).collect_data(config.SECTORS, config.MACRO_TICKERS)
+        print(f"📼 녹화 완료: {args.fixtures} ({recorder.totals()['requests']} requests)")
+        sys.exit(0)
+
+    with Replayer(args.fixtures, parse_latency(args.latency), args.default_latency) as replayer:
+        results = run_benchmark(replayer, args.workers)
+    print_table(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = check_baseline(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\n❌ 성능 회귀 감지:\n  " + "\n  ".join(regressions))
+            sys.exit(1)
+        print("\n✅ 기준 대비 성능 회귀 없음")
@@ -108,9 +108,205 @@ SYSTEM_ROLE = """
 # ==========================================
 TELEGRAM_TOKEN = os.environ.get("TELEGRAM_TOKEN")
 TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID")
+# 여러 채팅방으로 동시 발송 시 쉼표로 구분 (없으면 TELEGRAM_CHAT_ID 하나)
+TELEGRAM_CHAT_IDS = [c.strip() for c in (os.environ.get("TELEGRAM_CHAT_IDS") or TELEGRAM_CHAT_ID or "").split(",") if c.strip()]
 OPENDART_API_KEY = os.environ.get("OPENDART_API_KEY")
 DATA_GO_KR_API_KEY = os.environ.get("DATA_GO_KR_API_KEY") # 공공데이터포털
 GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
 
 if not GOOGLE_API_KEY:
-    print("⚠️  [Config] GOOGLE_API_KEY가 없습니다. AI 분석 기능이 제한됩니다.")
\ No newline at end of file
+    print("⚠️  [Config] GOOGLE_API_KEY가 없습니다. AI 분석 기능이 제한됩니다.")
+
+# ==========================================
+# 7. ⚡ 수집 성능 설정 (Scout)
+# ==========================================
+# 동시 fetch 스레드 상한 (1이면 기존 순차 수집)
+SCOUT_MAX_WORKERS = int(os.environ.get("SCOUT_MAX_WORKERS", "8"))
+
+# 공용 HTTP 전송 계층 (engines/transport.py)
+HTTP_TIMEOUT = (3.05, 10)  # (connect, read) 초
+HTTP_RETRIES = 2           # 연결 실패 / 429 / 5xx 재시도 횟수
+HTTP_BACKOFF = 0.5         # 재시도 간격 (0.5s, 1s, 2s ...)
+HTTP_DEFAULT_HOST_LIMIT = 8
+HTTP_HOST_LIMITS = {       # 호스트별 동시 요청 상한
+    "search.naver.com": 4,
+    "finance.naver.com": 2,
+    "apis.data.go.kr": 2,
+    "opendart.fss.or.kr": 2,
+    "api.telegram.org": 4,
+}
+
+# 로컬 디스크 캐시 (실행 간 유지, GitHub Actions에서는 actions/cache로 복원)
+CACHE_DIR = os.environ.get("CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache"))
+CACHE_MAX_ENTRIES = 5000
+CACHE_TTLS = {                      # 필드별 유효기간 (초)
+    "price": 5 * 60,                # 시세: 분 단위
+    "prev": 5 * 60,
+    "grossMargins": 7 * 24 * 3600,  # 재무 지표: 분기 단위로만 변하므로 일 단위
+    "operatingMargins": 7 * 24 * 3600,
+    "returnOnEquity": 7 * 24 * 3600,
+}
+
+# 로컬 일봉 저장소 (data/timeseries.py)
+TIMESERIES_INITIAL_PERIOD = "2y"  # 처음 보는 심볼의 최초 수집 기간 (이후는 새 봉만)
+MACRO_LOOKBACK_DAYS = 14          # 매크로 등락률 계산 구간 (휴장 대비 여유)
+
+# 리스크 지표 (engines/risk.py)
+RISK_WINDOW = 60          # 롤링 Z-Score 윈도우 (거래일)
+RISK_LOOKBACK_DAYS = 400  # 로컬 저장소에서 읽는 구간 (달력일, 윈도우 + 여유)
+SNR_NOISE_SIGMA = 1.0     # sigma_noise (Historical Average)
+
+# SNR / Panic 모델 판정 기준 (Brain 프롬프트 규칙과 동일)
+SNR_CRISIS_LEVEL = 3.0    # SNR > 3.0: SYSTEM CRISIS
+SNR_NOISE_LEVEL = 1.0     # SNR < 1.0: NOISE (역발상 매수 후보)
+FX_GATE = 1420            # USD/KRW > 1420: Iron Rule (현금)
+PULSE_SERIES = "PULSE"    # 시계열 저장소에 기록되는 일별 Pulse Score 심볼
+
+# 백테스트 (python -m engines.backtest [10y])
+BACKTEST_TARGET = "^KS11"              # 수익률 평가 대상 (KOSPI)
+BACKTEST_HORIZON = 5                   # 신호 후 평가 기간 (거래일)
+BACKTEST_WINDOWS = [20, 40, 60, 90, 120]
+BACKTEST_SIGMAS = [0.5, 0.75, 1.0, 1.5, 2.0]
+BACKTEST_GATES = [1350, 1380, 1400, 1420, 1450]
+
+# 실행 마감 예산 (engines/deadline.py) - 느린 소스 하나가 리포트를 늦추지 않도록
+RUN_DEADLINE_SEC = int(os.environ.get("RUN_DEADLINE_SEC", "240"))        # 시작 ~ 리포트 전송까지 총 예산
+COLLECT_DEADLINE_SEC = int(os.environ.get("COLLECT_DEADLINE_SEC", "120")) # Scout 수집 총 예산
+REPORT_SEND_BY = os.environ.get("REPORT_SEND_BY", "08:50")                # (KST) 이 시각 전에는 반드시 전송
+MISSION_BUDGETS = {   # 임무별 예산 (초, 수집 시작 기준)
+    "prefetch": 45,
+    "risk_indices": 90,   # FRED / VIX
+    "pulse_score": 40,
+    "market_index": 20,
+    "macro": 60,
+    "players": 60,        # pykrx
+    "policy_news": 40,
+    "micro": 90,
+    "safe_haven_data": 60,
+    "universe": 60,       # pykrx 전 종목 일괄 조회
+    "disclosures": 30,    # OpenDART 공시 목록
+}
+STALE_MAX_AGE = 7 * 24 * 3600  # 마지막 성공 값 보관 기간 (초)
+
+# ==========================================
+# 8. 🕐 시간대별 리포트 & 상주(daemon) 모드
+# ==========================================
+# (시작, 종료, 리포트 이름) - KST 기준
+REPORT_SLOTS = [
+    ("08:00", "09:00", "Market Open Check"),   # 장전 점검 (환율, 금리, 미 증시 마감 반영)
+    ("10:00", "11:00", "China-Korea Link"),    # 중국 증시 개장 영향 분석
+    ("19:00", "21:00", "Next Day Strategy"),   # 한국장 마감 + 미국장 개장 전
+]
+REPORT_DEFAULT_SLOT = "Current Market Status"
+
+# daemon.py: 각 시간대 시작 시각에 리포트 전송 + 장중 주기적 데이터 갱신
+DAEMON_REFRESH_MIN = 30                  # 장중 갱신 주기 (분)
+DAEMON_REFRESH_WINDOW = ("08:00", "16:00")  # 장중 갱신 구간 (KST)
+
+# ==========================================
+# 9. ⚡ 장중 임계값 알림 (engines/alerts.py)
+# ==========================================
+ALERT_ENABLED = os.environ.get("ALERT_ENABLED", "1") == "1"
+ALERT_POLL_SEC = 30       # 감시 주기 (초)
+ALERT_COOLDOWN_MIN = 30   # 같은 규칙 재알림 최소 간격 (분)
+ALERT_MOVE_PCT = 3.0      # 종목별 등락률 알림 기준 (±%)
+ALERT_RULES = [           # metric: 매크로 이름(USD/KRW 등), 티커, VIX_Z, VIX_Slope, SNR
+    {"name": "Exchange Rate Gate", "metric": "USD/KRW", "above": FX_GATE, "hysteresis": 5},
+    {"name": "VIX Z-Score", "metric": "VIX_Z", "above": 2.0, "hysteresis": 0.3},
+    {"name": "SNR Crisis", "metric": "SNR", "above": SNR_CRISIS_LEVEL, "hysteresis": 0.5},
+]
+
+# ==========================================
+# 10. 🧠 Brain 프롬프트 압축 & 응답 캐시 (engines/prompt.py) / 스트리밍 전송
+# ==========================================
+BRAIN_CACHE_TTL = 6 * 3600        # 같은 입력에 대한 분석 재사용 기간 (초)
+PROMPT_CHANGE_PCT = 0.5           # 상대 변화(%)가 이 이하면 '변화 없음'
+PROMPT_CHANGE_ABS = 0.05          # 절대 변화 하한 (Z, Slope, 등락률 등 작은 값용)
+PROMPT_DELTA_MAX_AGE = 4 * 3600   # 직전 브리핑 + 변화분만 보내는 최대 간격 (초, 같은 날만)
+BRAIN_STREAMING = os.environ.get("BRAIN_STREAMING", "1") == "1"  # AI 리포트를 섹션 완성 즉시 텔레그램 전송
+
+# ==========================================
+# 11. 📨 텔레그램 발송 큐 (notifiers/delivery.py)
+# ==========================================
+TELEGRAM_GLOBAL_RATE = 25       # 봇 전체 초당 발송 상한 (텔레그램 한도 약 30/s)
+TELEGRAM_CHAT_INTERVAL = 1.0    # 같은 채팅방 발송 최소 간격 (초, 그룹은 분당 20건 한도)
+TELEGRAM_MAX_ATTEMPTS = 4       # 일시 오류(네트워크/5xx) 재시도 횟수 (429는 retry_after 대기, 횟수 미포함)
+TELEGRAM_BACKOFF = 1.0          # 재시도 간격 (1s, 2s, 4s ...)
+TELEGRAM_DRAIN_TIMEOUT = 60     # 한 번 전송 시 최대 대기 (초, 남은 조각은 큐 파일에 보관)
+TELEGRAM_MAX_WORKERS = 8        # 동시에 전송하는 채팅방 수
+TELEGRAM_MAX_AGE = 1800         # 대기열 보관 한도 (초, 넘은 리포트/알림 조각은 보내지 않고 폐기)
+
+# ==========================================
+# 12. 📄 HTML 파싱 (engines/parsing.py)
+# ==========================================
+HTML_PARSER = os.environ.get("HTML_PARSER", "auto")  # auto(lxml 설치 시 lxml) / lxml / bs4-lxml / bs4 / html.parser.full
+HTML_PROCESS_WORKERS = int(os.environ.get("HTML_PROCESS_WORKERS", "0"))  # >0 이면 별도 프로세스에서 파싱
+
+# ==========================================
+# 13. 🔭 전 종목 스캔 (engines/universe.py)
+# ==========================================
+UNIVERSE_SCAN = os.environ.get("UNIVERSE_SCAN", "1") == "1"  # collect_data에 전 종목 스캔 임무 포함
+UNIVERSE_MARKETS = ("KOSPI", "KOSDAQ")
+UNIVERSE_WEIGHTS = {"foreign": 40, "inst": 30, "price": 30}  # README 수급 점수
+UNIVERSE_MIN_VALUE = 10   # 최소 거래대금 (억 원, 미만은 노이즈로 제외)
+UNIVERSE_TOP_N = 10       # 리포트에 노출할 상위 종목 수 (BUY_THRESHOLD 이상만)
+
+# ==========================================
+# 14. 🏦 KRX 수급 저장소 (data/flows.py)
+# ==========================================
+FLOW_INITIAL_PERIOD = "60d"  # 처음 한 번 적재하는 구간 (이후는 저장되지 않은 날만)
+
+# ==========================================
+# 15. 📅 거래소 달력 (data/sessions.py)
+# ==========================================
+# holidays 금융 달력 코드 + 정규장 시간 (현지 시각), CACHE_DIR/calendar_<이름>.json에 보관
+CALENDARS = {
+    "KRX": {"code": "XKRX", "tz": "Asia/Seoul", "open": "09:00", "close": "15:30"},
+    "NYSE": {"code": "XNYS", "tz": "America/New_York", "open": "09:30", "close": "16:00"},
+}
+CALENDAR_START_YEAR = 2015  # 달력 시작 연도 (끝은 내년 말까지, 해가 바뀌면 재생성)
+CALENDAR_SETTLE_MIN = 30    # 장 마감 후 이 시간(분)이 지나 수집한 봉만 확정으로 간주
+
+# ==========================================
+# 16. 📰 기사 색인 / 감쇠 Pulse (data/articles.py)
+# ==========================================
+PULSE_HALF_LIFE_HOURS = 6    # 키워드 점수 반감기 (기사 1건의 기여가 6시간마다 절반)
+PULSE_MIN_SCORE = 0.1        # matches에 표기할 최소 키워드 점수
+ARTICLE_DUP_BITS = 3         # 제목 SimHash 해밍 거리 이하면 같은 기사 (재송고/전재)
+ARTICLE_RETENTION_DAYS = 14  # 색인 보존 기간
+GPR_RECENT_HOURS = 24        # GPR Proxy: 이 시간 안에 기사가 있어야 키워드 적중
+
+# ==========================================
+# 17. 📑 DART 공시 (data/disclosures.py, OPENDART_API_KEY 있을 때만)
+# ==========================================
+DISCLOSURE_INITIAL_DAYS = 30      # 처음 적재하는 구간 (종목별 조회)
+DISCLOSURE_LOOKBACK_DAYS = 7      # 리포트에 싣는 최근 공시 기간
+DISCLOSURE_TOP_N = 10             # 리포트에 싣는 최대 건수
+DART_BULK_MAX_DAYS = 3            # 워터마크가 이보다 오래되면 전체 목록 대신 종목별 조회
+DART_MAX_PAGES = 20               # 한 번 조회에서 넘길 최대 페이지 (페이지당 100건)
+DART_CORP_CODE_TTL = 7 * 24 * 3600  # 종목코드 -> 고유번호 매핑 캐시 (초)
+# 보고서명에 포함되면 주요 공시로 분류
+DISCLOSURE_MATERIAL = [
+    "주요사항보고", "유상증자", "무상증자", "감자", "전환사채", "신주인수권", "교환사채",
+    "합병", "분할", "자기주식", "최대주주", "공급계약", "잠정", "영업정지", "소송",
+    "횡령", "배임", "조회공시", "상장폐지", "거래정지", "불성실공시",
+]
+
+# ==========================================
+# 18. 🩺 소스 상태 / 차단기 (engines/health.py, CACHE_DIR/health.json)
+# ==========================================
+HEALTH_HOSTS = {  # transport 호스트 -> 소스 이름 (yfinance/fred/krx/gemini는 호출부에서 직접 기록)
+    "search.naver.com": "naver_search",
+    "finance.naver.com": "naver_sise",
+    "apis.data.go.kr": "data_go_kr",
+    "opendart.fss.or.kr": "dart",
+    "api.telegram.org": "telegram",
+}
+HEALTH_FAIL_STATUS = {  # 5xx 외에 소스 전체 장애로 보는 상태 코드 (텔레그램 403 등 채팅방 단위 오류는 제외)
+    "data_go_kr": (403,),   # 활용신청 만료/키 차단
+}
+HEALTH_FAILURE_THRESHOLD = 3  # 연속 실패 횟수 -> 차단
+HEALTH_OPEN_SEC = 300         # 차단 후 첫 시험 호출까지 (실패할 때마다 2배)
+HEALTH_OPEN_MAX_SEC = 3600    # 쿨다운 상한
+HEALTH_EWMA_ALPHA = 0.2       # 성공률/지연시간 지수 평균 가중치
+HEALTH_WARN_RATE = 0.8        # 성공률이 이보다 낮으면 리포트에 ⚠️ 표기
@@ -0,0 +1,82 @@
+"""
+[V16.23] 상주(daemon) 모드 진입점
+
+    python daemon.py
+
+- 프로세스를 띄워 둔 채 config.REPORT_SLOTS 시각마다 리포트 전송 (schedule 사용)
+- Scout/Brain, 로컬 캐시, HTTP 커넥션 풀을 재사용 (매 실행 import/핸드셰이크 비용 제거)
+- 장중에는 DAEMON_REFRESH_MIN 분마다 데이터를 미리 갱신하여 캐시를 따뜻하게 유지
+"""
+import datetime
+import logging
+import threading
+import time
+
+import pytz
+import schedule
+
+import config
+from main import _init_brain, _new_scout, deliver_report
+from engines.alerts import Watcher
+from data.sessions import get_calendar
+from data.timeseries import open_timeseries_store
+from notifiers.telegram_bot import send_message
+
+KST = "Asia/Seoul"
+
+
+class Daemon:
+    def __init__(self):
+        self.scout = _new_scout()
+        self.brain = _init_brain()
+        self.latest = None # 마지막 장중 갱신 데이터
+        # [V16.25] 장중 임계값 알림 (별도 스레드, 리포트 생성 중에도 계속 감시)
+        self.watcher = Watcher(send_message, store=open_timeseries_store(), pulse=self.latest_pulse)
+
+    def latest_pulse(self):
+        if not self.latest:
+            return Watcher._stored_pulse(self.watcher.vix.store)
+        return float(self.latest.get("pulse_score", {}).get("score", 0))
+
+    def report(self):
+        """시간대 리포트 (에러가 나도 상주 프로세스는 유지)"""
+        try:
+            if self.brain is None:
+                self.brain = _init_brain() # 초기화 실패했던 경우 재시도
+            deliver_report(self.scout, self.brain)
+        except Exception as e:
+            logging.error(f"❌ 리포트 실패: {e}")
+            try:
+                send_message(f"⚠️ **[Bot Error]** 리포트 생성 중 에러 발생:\n{str(e)}")
+            except Exception:
+                pass
+
+    def refresh(self):
+        """장중 데이터 갱신 (리포트 전송 없음)"""
+        now = datetime.datetime.now(pytz.timezone(KST))
+        start, end = config.DAEMON_REFRESH_WINDOW
+        if not get_calendar("KRX").is_session(now.date()) or not (start <= now.strftime("%H:%M") < end):
+            return
+        try:
+            self.latest = self.scout.collect_data(config.SECTORS, config.MACRO_TICKERS)
+            logging.info(f"🔄 장중 갱신 완료 (SNR: {self.latest.get('snr')})")
+        except Exception as e:
+            logging.error(f"❌ 장중 갱신 실패: {e}")
+
+    def schedule(self):
+        for start, _, title in config.REPORT_SLOTS:
+            schedule.every().day.at(start, KST).do(self.report).tag("report", title)
+        schedule.every(config.DAEMON_REFRESH_MIN).minutes.do(self.refresh).tag("refresh")
+
+    def run_forever(self):
+        self.schedule()
+        if config.ALERT_ENABLED:
+            threading.Thread(target=self.watcher.run_forever, name="alert-watcher", daemon=True).start()
+        logging.info("🛰️ Daemon 가동: " + ", ".join(f"{s}({t})" for s, _, t in config.REPORT_SLOTS))
+        while True:
+            schedule.run_pending()
+            time.sleep(max(min(schedule.idle_seconds() or 1, 30), 1))
+
+
+if __name__ == "__main__":
+    Daemon().run_forever()
@@ -0,0 +1,156 @@
+# data/articles.py
+import hashlib
+import math
+import os
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import config
+
+_BRACKETS = re.compile(r"[\[\(【<][^\]\)】>]{0,10}[\]\)】>]") # [속보], (종합), 【단독】 등 머리표
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_title(title):
+    """머리표/문장부호/공백 제거 + 소문자 (언론사별 표기 차이 흡수)"""
+    return _NON_WORD.sub("", _BRACKETS.sub("", title or "")).lower()
+
+
+def fingerprint(title):
+    """
+    제목 근사 중복 판정용 64비트 SimHash (문자 2-gram)
+    - 조사/어미 몇 글자만 다른 재송고 기사는 해밍 거리가 작게 나옴
+    """
+    text = normalize_title(title)
+    grams = [text[i:i + 2] for i in range(len(text) - 1)] or [text]
+    weights = [0] * 64
+    for gram in grams:
+        h = int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if h >> bit & 1 else -1
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def hamming(a, b):
+    return bin(a ^ b).count("1")
+
+
+class ArticleIndex:
+    """
+    [V16.34] 이미 본 뉴스 기사 색인 (키워드 x URL, 제목 SimHash)
+    - 같은 URL 또는 제목이 거의 같은 기사(재송고/언론사 전재)는 한 번만 '새 기사'로 취급
+    - 키워드별 감쇠 기사 수를 상태로 저장 -> 매 실행 새 기사만 더해서 갱신 (점수는 키워드 가중치로 상한)
+    - SQLite 파일이라 실행(프로세스) 간 유지
+    """
+    def __init__(self, path, half_life_hours=None, dup_bits=None, retention_days=None):
+        self.path = path
+        self.half_life = (half_life_hours or config.PULSE_HALF_LIFE_HOURS) * 3600
+        self.dup_bits = config.ARTICLE_DUP_BITS if dup_bits is None else dup_bits
+        self.retention = timedelta(days=retention_days or config.ARTICLE_RETENTION_DAYS)
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS articles ("
+                " keyword TEXT NOT NULL, url TEXT NOT NULL, fingerprint TEXT, title TEXT,"
+                " published REAL, seen REAL, dup INTEGER DEFAULT 0,"
+                " PRIMARY KEY (keyword, url))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS articles_recent ON articles (keyword, published)")
+            # 키워드별 감쇠 기사 수 n (at 시점 값)
+            conn.execute("CREATE TABLE IF NOT EXISTS pulse_counts (keyword TEXT PRIMARY KEY, n REAL, at REAL)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn: # 정상 종료 시 commit, 예외 시 rollback
+                yield conn
+        finally:
+            conn.close()
+
+    def _decay(self, seconds):
+        return math.exp(-math.log(2) * max(seconds, 0.0) / self.half_life)
+
+    def observe(self, keyword, items, now=None):
+        """
+        검색 결과 items([{"title", "link", "time"}, ...]) 중 처음 본 기사만 반환 (읽기 전용)
+        - 기사 시각을 모르면 처음 본 시각으로 간주
+        - 색인 기록은 commit()에서 Pulse 상태와 함께 (Pulse가 채택되지 않으면 다음 실행에 다시 '새 기사')
+        - 재송고 기사(제목 SimHash 근사 중복)는 제외하고 기록도 하지 않음 (원문이 색인되면 계속 제외됨)
+        """
+        now = now or datetime.now()
+        fresh = []
+        with self._connect() as conn:
+            known = {url for (url,) in conn.execute("SELECT url FROM articles WHERE keyword = ?", (keyword,))}
+            since = (now - self.retention).timestamp()
+            prints = [int(fp, 16) for (fp,) in conn.execute(
+                "SELECT fingerprint FROM articles WHERE keyword = ? AND published >= ?", (keyword, since))]
+
+        for item in items:
+            url = item.get("link") or item.get("title")
+            if not url or url in known:
+                continue
+            known.add(url)
+            fp = fingerprint(item.get("title"))
+            if any(hamming(fp, other) <= self.dup_bits for other in prints):
+                continue
+            prints.append(fp)
+            published = min(item.get("time") or now, now)
+            fresh.append({**item, "time": published,
+                          "_row": (keyword, url, f"{fp:016x}", item.get("title"), published.timestamp(), now.timestamp(), 0)})
+        return fresh
+
+    def recent(self, keyword, hours, now=None):
+        """최근 hours 시간 안에 나온 (중복 제외) 기사 수"""
+        since = ((now or datetime.now()) - timedelta(hours=hours)).timestamp()
+        with self._connect() as conn:
+            (count,) = conn.execute(
+                "SELECT COUNT(*) FROM articles WHERE keyword = ? AND dup = 0 AND published >= ?",
+                (keyword, since)).fetchone()
+        return count
+
+    def pulse(self, weights, fresh, now=None):
+        """
+        키워드별 감쇠 점수 계산 (저장하지 않음) -> ({키워드: 점수}, 저장할 감쇠 상태)
+        - 상태 n(now) = n(at) x 2^(-경과/반감기) + Σ 2^(-(now - 기사 시각)/반감기)  (새 기사만)
+        - 점수 = weight x (1 - e^(-n)) : 키워드당 최대 weight -> 합계는 기존 0 ~ Σweight 범위 유지
+          (SNR 임계값/과거 PULSE 시계열과 같은 척도)
+        - 오래된 기사는 처음 보더라도 거의 더해지지 않음 -> 점수는 '지금' 뉴스 속도를 반영
+        """
+        now = now or datetime.now()
+        t = now.timestamp()
+        with self._connect() as conn:
+            stored = {kw: (count, at) for kw, count, at in conn.execute("SELECT keyword, n, at FROM pulse_counts")}
+        state, scores = {}, {}
+        for keyword, weight in weights.items():
+            count, at = stored.get(keyword, (0.0, t))
+            count *= self._decay(t - at)
+            count += sum(self._decay(t - item["time"].timestamp()) for item in fresh.get(keyword, []))
+            state[keyword] = count
+            scores[keyword] = weight * (1.0 - math.exp(-count))
+        return scores, state
+
+    def commit(self, fresh, state, now=None):
+        """pulse() 결과 채택 시 새 기사 색인 + 감쇠 상태를 한 트랜잭션으로 저장"""
+        t = (now or datetime.now()).timestamp()
+        rows = [item["_row"] for items in fresh.values() for item in items]
+        with self._lock, self._connect() as conn:
+            conn.executemany("INSERT OR IGNORE INTO articles VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.executemany("INSERT OR REPLACE INTO pulse_counts (keyword, n, at) VALUES (?, ?, ?)",
+                             [(keyword, count, t) for keyword, count in state.items()])
+
+    def prune(self, now=None):
+        """보존 기간이 지난 기사 삭제"""
+        since = ((now or datetime.now()) - self.retention).timestamp()
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM articles WHERE published < ?", (since,))
+
+
+def open_article_index():
+    """config 기반 공용 기사 색인 (CACHE_DIR/articles.db)"""
+    return ArticleIndex(os.path.join(config.CACHE_DIR, "articles.db"))
@@ -0,0 +1,119 @@
+# data/cache.py
+import json
+import os
+import threading
+import time
+
+import config
+
+
+class TTLCache:
+    """
+    [V16.16] 로컬 디스크 TTL 캐시 (티커 x 필드)
+    - 필드별 TTL: 시세(분 단위) vs 마진/ROE(일 단위)
+    - 최대 개수 초과 시 가장 오래 안 쓴 항목부터 제거 (LRU)
+    - JSON 파일로 저장되어 실행(프로세스) 간 유지
+    """
+    def __init__(self, path, ttls=None, default_ttl=3600, max_entries=5000):
+        self.path = path
+        self.ttls = ttls if ttls is not None else {}
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._dirty = False
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _key(ticker, field):
+        return f"{ticker}|{field}"
+
+    def get(self, ticker, field, default=None):
+        """TTL 이내의 값 반환 (없거나 만료되면 default)"""
+        key = self._key(ticker, field)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if now - entry["t"] > self.ttls.get(field, self.default_ttl):
+                del self._entries[key]
+                self._dirty = True
+                return default
+            entry["a"] = now
+            self._dirty = True
+            return entry["v"]
+
+    def get_many(self, ticker, fields):
+        """모든 필드가 유효할 때만 {field: value}, 하나라도 만료면 None"""
+        values = {}
+        for field in fields:
+            value = self.get(ticker, field, default=self)
+            if value is self:
+                return None
+            values[field] = value
+        return values
+
+    def set(self, ticker, field, value):
+        self.set_many(ticker, {field: value})
+
+    def set_many(self, ticker, values):
+        now = time.time()
+        with self._lock:
+            for field, value in values.items():
+                self._entries[self._key(ticker, field)] = {"v": value, "t": now, "a": now}
+            self._dirty = True
+            self._evict()
+
+    def invalidate(self, ticker=None, field=None):
+        """명시적 무효화 (인자 없으면 전체 삭제)"""
+        with self._lock:
+            for key in list(self._entries):
+                t, f = key.split("|", 1)
+                if (ticker is None or t == ticker) and (field is None or f == field):
+                    del self._entries[key]
+            self._dirty = True
+
+    def _evict(self):
+        overflow = len(self._entries) - self.max_entries
+        if overflow > 0:
+            oldest = sorted(self._entries, key=lambda k: self._entries[k]["a"])[:overflow]
+            for key in oldest:
+                del self._entries[key]
+
+    def save(self):
+        """변경 사항이 있을 때만 원자적으로 파일 기록"""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+            self._dirty = False
+
+
+def open_ticker_cache():
+    """config 기반 공용 티커 캐시"""
+    return TTLCache(
+        os.path.join(config.CACHE_DIR, "tickers.json"),
+        ttls=config.CACHE_TTLS,
+        max_entries=config.CACHE_MAX_ENTRIES,
+    )
+
+
+if __name__ == "__main__":
+    # 사용법: python -m data.cache [티커] [필드]  -> 해당 항목 무효화 (인자 없으면 전체)
+    import sys
+    cache = open_ticker_cache()
+    args = sys.argv[1:] + [None, None]
+    cache.invalidate(args[0], args[1])
+    cache.save()
+    print(f"🧹 캐시 무효화 완료: ticker={args[0] or '*'}, field={args[1] or '*'}")
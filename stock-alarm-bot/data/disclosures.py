@@ -0,0 +1,200 @@
+# data/disclosures.py
+import io
+import os
+import sqlite3
+import threading
+import zipfile
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import config
+from data.cache import TTLCache
+from data.portfolio import ACTIVE_PORTFOLIO, SAFE_PORTFOLIO
+from data.snapshot import Disclosure
+from engines import transport
+from engines.profiler import span
+
+API = "https://opendart.fss.or.kr/api"
+PAGE_COUNT = 100 # list.json 페이지당 최대 건수
+
+
+class DartError(Exception):
+    """OpenDART status 코드 오류 (000 정상 / 013 조회 결과 없음 제외)"""
+
+
+def watched_codes():
+    """config.SECTORS + data/portfolio.py 의 국내 종목코드 (6자리, 중복 제거)"""
+    codes = [ticker.split(".")[0] for stocks in config.SECTORS.values() for ticker in stocks
+             if ticker.endswith((".KS", ".KQ"))]
+    codes += list(SAFE_PORTFOLIO) + list(ACTIVE_PORTFOLIO)
+    return list(dict.fromkeys(codes))
+
+
+def is_material(report_name, keywords=None):
+    """보고서명에 DISCLOSURE_MATERIAL 키워드가 있으면 주요 공시"""
+    keywords = config.DISCLOSURE_MATERIAL if keywords is None else keywords
+    return any(keyword in report_name for keyword in keywords)
+
+
+def _call(endpoint, params):
+    res = transport.get(f"{API}/{endpoint}", params={"crtfc_key": config.OPENDART_API_KEY, **params})
+    res.raise_for_status()
+    return res
+
+
+def fetch_list(page_no=1, **params):
+    """list.json 1페이지 -> (items, total_page)"""
+    body = _call("list.json", {"page_no": page_no, "page_count": PAGE_COUNT, **params}).json()
+    status = body.get("status")
+    if status == "013":
+        return [], 0
+    if status != "000":
+        raise DartError(f"{status} {body.get('message')}")
+    return body.get("list", []), int(body.get("total_page", 1))
+
+
+def fetch_corp_codes():
+    """corpCode.xml (zip) -> {종목코드: 고유번호} (상장사만)"""
+    from xml.etree import ElementTree
+    res = _call("corpCode.xml", {})
+    with span("parse", "dart:corp_codes"):
+        with zipfile.ZipFile(io.BytesIO(res.content)) as archive:
+            root = ElementTree.fromstring(archive.read(archive.namelist()[0]))
+        return {
+            item.findtext("stock_code").strip(): item.findtext("corp_code")
+            for item in root.iter("list")
+            if (item.findtext("stock_code") or "").strip()
+        }
+
+
+class DisclosureStore:
+    """
+    [V16.35] OpenDART 공시 증분 수집기 (감시 종목 = SECTORS + 포트폴리오)
+    - 접수번호(rcept_no, 접수일+일련번호) 워터마크 이후 공시만 수집/저장
+    - 평소: 전체 시장 목록을 날짜 범위로 최신순 조회하다 워터마크에 닿으면 중단 (보통 1페이지)
+      DART_MAX_PAGES 안에 워터마크에 닿지 못하면 종목별 조회로 대체 (중간 공시를 건너뛴 채 워터마크가 앞서가지 않도록)
+    - 워터마크가 없거나 DART_BULK_MAX_DAYS보다 오래됐으면 종목별(corp_code) 조회로 초기 적재
+      (종목코드 -> 고유번호 매핑은 corpCode.xml을 받아 DART_CORP_CODE_TTL 동안 로컬 캐시)
+    """
+    def __init__(self, path, codes=None, corp_cache=None, fetch=None, fetch_codes=None):
+        self.path = path
+        self.codes = set(codes if codes is not None else watched_codes())
+        self.corp_cache = corp_cache or TTLCache(os.path.join(config.CACHE_DIR, "dart_corp_codes.json"),
+                                                 default_ttl=config.DART_CORP_CODE_TTL)
+        self._fetch = fetch or fetch_list
+        self._fetch_codes = fetch_codes or fetch_corp_codes
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS disclosures ("
+                " rcept_no TEXT PRIMARY KEY, stock_code TEXT, corp_name TEXT, report_nm TEXT,"
+                " rcept_dt TEXT, material INTEGER, seen TEXT)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS disclosures_recent ON disclosures (stock_code, rcept_dt)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn: # 정상 종료 시 commit, 예외 시 rollback
+                yield conn
+        finally:
+            conn.close()
+
+    def watermark(self):
+        with self._connect() as conn:
+            (mark,) = conn.execute("SELECT MAX(rcept_no) FROM disclosures").fetchone()
+        return mark
+
+    def corp_codes(self):
+        """감시 종목 {종목코드: 고유번호} (캐시에 없는 종목이 있을 때만 corpCode.xml 재다운로드)"""
+        cached = self.corp_cache.get_many("dart", sorted(self.codes))
+        if cached is None:
+            mapping = self._fetch_codes()
+            self.corp_cache.set_many("dart", {code: mapping.get(code) for code in self.codes})
+            self.corp_cache.save()
+            cached = {code: mapping.get(code) for code in self.codes}
+        return {code: corp for code, corp in cached.items() if corp} # ETF 등 고유번호 없는 종목 제외
+
+    def _bulk(self, mark, today):
+        """전체 시장 목록 최신순 조회 -> (워터마크 이후 항목, 워터마크까지 모두 받았는지)"""
+        items, page, pages = [], 1, 1
+        while page <= min(pages, config.DART_MAX_PAGES):
+            rows, pages = self._fetch(page, bgn_de=mark[:8], end_de=today)
+            for row in rows:
+                if row["rcept_no"] <= mark:
+                    return items, True
+                items.append(row)
+            page += 1
+        return items, page > pages # 페이지 상한에서 끊겼으면 False
+
+    def _per_corp(self, begin, today):
+        """종목별 조회 (초기 적재 / 워터마크가 오래된 경우)"""
+        items = []
+        for corp in self.corp_codes().values():
+            page, pages = 1, 1
+            while page <= min(pages, config.DART_MAX_PAGES):
+                rows, pages = self._fetch(page, corp_code=corp, bgn_de=begin, end_de=today)
+                items += rows
+                page += 1
+        return items
+
+    def poll(self, now=None):
+        """
+        새 공시 수집/저장 -> 이번에 새로 저장된 감시 종목 공시 [Disclosure, ...]
+        """
+        now = now or datetime.now()
+        today = now.strftime("%Y%m%d")
+        with self._lock:
+            mark = self.watermark()
+            bulk_from = (now - timedelta(days=config.DART_BULK_MAX_DAYS)).strftime("%Y%m%d")
+            if mark and mark[:8] >= bulk_from:
+                items, complete = self._bulk(mark, today)
+                if not complete:
+                    print(f"    ⚠️ DART: 전체 목록 {config.DART_MAX_PAGES}페이지 안에 워터마크 미도달 -> 종목별 조회")
+                    items = [row for row in self._per_corp(mark[:8], today) if row["rcept_no"] > mark]
+            else:
+                begin = max(mark[:8], bulk_from) if mark else (now - timedelta(days=config.DISCLOSURE_INITIAL_DAYS)).strftime("%Y%m%d")
+                items = [row for row in self._per_corp(begin, today) if not mark or row["rcept_no"] > mark]
+            items = list({row["rcept_no"]: row for row in items}.values())
+
+            seen = now.strftime("%Y-%m-%d %H:%M:%S")
+            rows = [
+                (row["rcept_no"], row.get("stock_code", ""), row.get("corp_name", ""), row.get("report_nm", "").strip(),
+                 row.get("rcept_dt", ""), int(is_material(row.get("report_nm", ""))), seen)
+                for row in items if row.get("stock_code") in self.codes
+            ]
+            # 감시 종목이 아닌 최신 공시도 워터마크로 남김 (다음 조회가 같은 페이지를 다시 넘기지 않도록)
+            newest = max((row["rcept_no"] for row in items), default=None)
+            if newest and newest > (mark or "") and not any(r[0] == newest for r in rows):
+                rows.append((newest, "", "", "", newest[:8], 0, seen))
+            with self._connect() as conn:
+                before = conn.total_changes
+                conn.executemany("INSERT OR IGNORE INTO disclosures VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+                added = conn.total_changes - before
+        print(f"    📑 DART: 새 공시 {len([r for r in rows if r[1]])}건 ({added}행 저장, 워터마크 {newest or mark})")
+        return [self._record(row) for row in rows if row[1]]
+
+    def recent(self, days=None, material_only=True, now=None):
+        """최근 days일 감시 종목 공시 (최신순)"""
+        days = config.DISCLOSURE_LOOKBACK_DAYS if days is None else days
+        since = ((now or datetime.now()) - timedelta(days=days)).strftime("%Y%m%d")
+        query = "SELECT * FROM disclosures WHERE stock_code != '' AND rcept_dt >= ?"
+        if material_only:
+            query += " AND material = 1"
+        with self._connect() as conn:
+            rows = conn.execute(query + " ORDER BY rcept_no DESC", (since,)).fetchall()
+        return [self._record(row) for row in rows]
+
+    @staticmethod
+    def _record(row):
+        rcept_no, code, name, report, date, material, seen = row
+        return Disclosure(rcept_no=rcept_no, code=code, name=name, report=report, date=date,
+                          material=bool(material), at=seen)
+
+
+def open_disclosure_store():
+    """config 기반 공시 저장소 (CACHE_DIR/disclosures.db)"""
+    return DisclosureStore(os.path.join(config.CACHE_DIR, "disclosures.db"))
@@ -0,0 +1,102 @@
+# data/flows.py
+import os
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+import config
+from data.sessions import get_calendar
+from data.timeseries import TimeSeriesStore
+from engines import health
+from engines.profiler import span
+
+# 투자자 구분 -> pykrx 컬럼
+INVESTORS = {"foreign": "외국인", "inst": "기관합계", "ant": "개인"}
+EOK = 100_000_000 # 억 원
+
+
+def flow_symbol(market, investor):
+    """시계열 저장소 심볼 (예: FLOW:KOSPI:foreign)"""
+    return f"FLOW:{market}:{investor}"
+
+
+def _period_days(period):
+    return int(str(period).rstrip("d"))
+
+
+def download_flows(symbols, period=None, start=None):
+    """
+    TimeSeriesStore fetch 규약으로 투자자별 일별 순매수(원) 조회
+    - 시장당 pykrx 1회 (start ~ 오늘), 반환: columns=심볼, index=날짜
+    """
+    with span("import", "pykrx"):
+        from pykrx import stock
+    today = datetime.now()
+    begin = pd.Timestamp(start) if start else today - timedelta(days=_period_days(period))
+    markets = dict.fromkeys(symbol.split(":")[1] for symbol in symbols)
+
+    columns = {}
+    for market in markets:
+        with health.guard("krx"), span("http", f"krx:trading_value_by_date:{market}", host="krx"):
+            df = stock.get_market_trading_value_by_date(begin.strftime("%Y%m%d"), today.strftime("%Y%m%d"), market)
+        for investor, column in INVESTORS.items():
+            if column in df:
+                columns[flow_symbol(market, investor)] = df[column].astype(float)
+    return pd.DataFrame(columns)
+
+
+class FlowStore:
+    """
+    [V16.32] KRX 투자자별 순매수 일별 저장소
+    - 거래일별 값은 확정되면 바뀌지 않으므로 저장된 마지막 날(장중이면 덮어씀)부터만 조회
+    - 주간/월간/임의 구간 합계는 로컬에서 계산 (pykrx 요청은 보통 실행당 시장별 1회)
+    """
+    def __init__(self, store, market="KOSPI"):
+        self.store = store
+        self.market = market
+        self.symbols = {investor: flow_symbol(market, investor) for investor in INVESTORS}
+
+    def reset(self):
+        self.store.reset()
+
+    def refresh(self):
+        self.store.refresh(self.symbols.values())
+
+    def daily(self, start, end=None):
+        """start ~ end(포함) 일별 순매수 DataFrame (억 원, columns=foreign/inst/ant)"""
+        start = pd.Timestamp(start).normalize()
+        end = pd.Timestamp(end or datetime.now()).normalize()
+        days = (pd.Timestamp(datetime.now()).normalize() - start).days + 1
+        frame = pd.DataFrame({investor: self.store.window(symbol, days=days)
+                              for investor, symbol in self.symbols.items()})
+        return frame.loc[(frame.index >= start) & (frame.index <= end)] / EOK
+
+    def total(self, start, end=None):
+        """구간 합계 {'foreign', 'inst', 'ant'} (억 원, 정수)"""
+        sums = self.daily(start, end).sum()
+        return {investor: int(sums.get(investor, 0.0)) for investor in INVESTORS}
+
+    def week(self, offset=0, now=None):
+        """
+        이번 주(offset=0) / 지난주(offset=1) 합계
+        - [V16.33] KRX 달력 기준 그 주의 첫 ~ 마지막 영업일 (휴장 주간이면 0)
+        """
+        days = get_calendar("KRX").week(offset, now)
+        if days is None:
+            return dict.fromkeys(INVESTORS, 0)
+        return self.total(*days)
+
+    def month(self, now=None):
+        """이번 달 1일 ~ 오늘 합계"""
+        today = get_calendar("KRX").today(now)
+        return self.total(today.replace(day=1), today)
+
+
+def open_flow_store(market="KOSPI"):
+    """config 기반 수급 저장소 (시계열 DB 공유, 심볼 네임스페이스 FLOW:)"""
+    store = TimeSeriesStore(
+        os.path.join(config.CACHE_DIR, "timeseries.db"),
+        fetch=download_flows,
+        initial_period=config.FLOW_INITIAL_PERIOD,
+    )
+    return FlowStore(store, market)
@@ -0,0 +1,181 @@
+# data/sessions.py
+import bisect
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime, time, timedelta
+
+import pytz
+
+import config
+
+try:
+    import holidays
+except ImportError: # holidays 미설치 시 주말만 휴장으로 처리
+    holidays = None
+
+
+class TradingCalendar:
+    """
+    [V16.33] 거래소 영업일 달력
+    - 생성 시 구간 내 모든 날짜에 대해 '직전 영업일' 인덱스와 주차별 (첫, 마지막) 영업일을 미리 계산
+      -> 영업일 여부 / 직전 영업일 / N주 전 영업일 범위 / 장중 여부가 모두 O(1)
+    """
+    def __init__(self, name, sessions, tz, open_at, close_at):
+        self.name = name
+        self.tz = pytz.timezone(tz)
+        self.open_at = time.fromisoformat(open_at)
+        self.close_at = time.fromisoformat(close_at)
+        self.sessions = sorted(sessions)
+        self._session_set = set(self.sessions)
+        self.first, self.last = self.sessions[0], self.sessions[-1]
+
+        # 날짜 -> 그날 포함 직전 영업일 (구간 내 모든 달력일)
+        self._on_or_before = {}
+        current, i = None, 0
+        day = self.first
+        while day <= self.last:
+            if i < len(self.sessions) and self.sessions[i] == day:
+                current = day
+                i += 1
+            self._on_or_before[day] = current
+            day += timedelta(days=1)
+
+        # (ISO 연도, 주차) -> (첫 영업일, 마지막 영업일)
+        self._weeks = {}
+        for session in self.sessions:
+            key = session.isocalendar()[:2]
+            first, _ = self._weeks.get(key, (session, session))
+            self._weeks[key] = (first, session)
+
+    def now(self):
+        return datetime.now(self.tz)
+
+    def _today(self, now):
+        # naive 시각은 거래소 현지 시각으로 간주 (서버 시계가 UTC일 수 있으므로 호출부는 None 또는 tz-aware 권장)
+        now = now or self.now()
+        return now.astimezone(self.tz) if now.tzinfo else self.tz.localize(now)
+
+    def today(self, now=None):
+        """거래소 현지 기준 오늘 날짜"""
+        return self._today(now).date()
+
+    def is_session(self, day):
+        return day in self._session_set
+
+    def on_or_before(self, day):
+        """day 당일(영업일이면) 또는 그 이전 마지막 영업일"""
+        return self._on_or_before.get(day) if day <= self.last else self.last
+
+    def previous(self, day):
+        """day 이전(당일 제외) 마지막 영업일"""
+        return self.on_or_before(day - timedelta(days=1))
+
+    def last_started(self, now=None):
+        """장이 열린 적 있는 마지막 영업일 (장전이면 직전 영업일, 장중이면 오늘)"""
+        now = self._today(now)
+        today = now.date()
+        if self.is_session(today) and now.time() >= self.open_at:
+            return today
+        return self.previous(today)
+
+    def last_completed(self, now=None):
+        """장 마감까지 끝난 마지막 영업일 (장중/장전이면 직전 영업일)"""
+        now = self._today(now)
+        today = now.date()
+        if self.is_session(today) and now.time() >= self.close_at:
+            return today
+        return self.previous(today)
+
+    def is_open(self, now=None):
+        now = self._today(now)
+        return self.is_session(now.date()) and self.open_at <= now.time() < self.close_at
+
+    def week(self, offset=0, now=None):
+        """
+        offset주 전 주의 (첫 영업일, 마지막 영업일), 이번 주는 오늘까지만
+        - 휴장 주간이면 None
+        """
+        today = self._today(now).date()
+        key = (today - timedelta(weeks=offset)).isocalendar()[:2]
+        span = self._weeks.get(key)
+        if span is None:
+            return None
+        first, last = span
+        if first > today:
+            return None
+        return first, min(last, self.on_or_before(today))
+
+    def between(self, start, end):
+        """start ~ end(포함) 영업일 리스트"""
+        return self.sessions[bisect.bisect_left(self.sessions, start):bisect.bisect_right(self.sessions, end)]
+
+    def closed_at(self, day):
+        """day 장 마감 시각 (tz-aware)"""
+        return self.tz.localize(datetime.combine(day, self.close_at))
+
+
+def build_sessions(code, start_year, end_year):
+    """거래소 휴장일(holidays 금융 달력)을 뺀 평일 목록"""
+    closed = set()
+    if holidays is not None:
+        closed = set(holidays.financial_holidays(code, years=range(start_year, end_year + 1)))
+    else:
+        logging.warning("⚠️ holidays 미설치: 주말만 휴장으로 처리합니다.")
+    day, end = date(start_year, 1, 1), date(end_year, 12, 31)
+    sessions = []
+    while day <= end:
+        if day.weekday() < 5 and day not in closed:
+            sessions.append(day)
+        day += timedelta(days=1)
+    return sessions
+
+
+_calendars = {}
+_calendars_lock = threading.Lock()
+
+
+def _load(path, end_year):
+    try:
+        with open(path, encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("end_year", 0) < end_year or cached.get("holidays") != getattr(holidays, "__version__", None):
+        return None # 다음 해까지 포함하지 않거나 휴장일 데이터가 바뀌었으면 재생성
+    return [date.fromisoformat(d) for d in cached["sessions"]]
+
+
+def get_calendar(name="KRX"):
+    """
+    config.CALENDARS[name] 달력 (프로세스당 1회 생성, CACHE_DIR/calendar_<name>.json에 보관)
+    """
+    with _calendars_lock:
+        calendar = _calendars.get(name)
+        if calendar is not None:
+            return calendar
+
+        spec = config.CALENDARS[name]
+        end_year = datetime.now().year + 1
+        path = os.path.join(config.CACHE_DIR, f"calendar_{name}.json")
+        sessions = _load(path, end_year)
+        if sessions is None:
+            sessions = build_sessions(spec["code"], config.CALENDAR_START_YEAR, end_year)
+            os.makedirs(config.CACHE_DIR, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"end_year": end_year, "holidays": getattr(holidays, "__version__", None),
+                           "sessions": [d.isoformat() for d in sessions]}, f)
+
+        calendar = TradingCalendar(name, sessions, spec["tz"], spec["open"], spec["close"])
+        _calendars[name] = calendar
+        return calendar
+
+
+def calendar_for(symbol):
+    """yfinance 심볼이 따르는 거래소 달력 이름 (FX/선물/코인 등 상시 거래는 None)"""
+    if symbol.endswith((".KS", ".KQ")) or symbol in ("^KS11", "^KQ11") or symbol.startswith("FLOW:"):
+        return "KRX"
+    if symbol.startswith("^") or (symbol.replace(".", "").isalpha() and symbol.isupper() and symbol != config.PULSE_SERIES):
+        return "NYSE"
+    return None
@@ -0,0 +1,182 @@
+# data/snapshot.py
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+
+
+def now_stamp():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def parse_number(text):
+    """'54,321' / '+1.20%' / '$12.5' 같은 외부 문자열 -> float (해석 불가 시 None)"""
+    try:
+        return float(str(text).replace(",", "").replace("%", "").replace("$", "").strip())
+    except ValueError:
+        return None
+
+
+def _fmt(value, spec, missing="N/A"):
+    return missing if value is None else format(value, spec)
+
+
+@dataclass(slots=True)
+class Quote:
+    """가격 + 전일 대비 등락률(%)"""
+    price: float | None = None
+    change: float | None = None
+    at: str | None = None # 수집 시각
+
+    def as_dict(self):
+        return {"price": self.price, "change": self.change}
+
+    def render(self):
+        if self.price is None or self.change is None:
+            return "N/A"
+        return f"{self.price:,.2f} ({self.change:+.2f}%)"
+
+
+@dataclass(slots=True)
+class StockSnapshot:
+    """섹터 종목 시세 + 재무 지표 (마진/ROE는 비율, 0.381 = 38.1%)"""
+    code: str
+    price: float | None = None
+    change: float | None = None
+    gpm: float | None = None
+    opm: float | None = None
+    roe: float | None = None
+    at: str | None = None
+
+    @property
+    def domestic(self):
+        return "KS" in self.code or "KQ" in self.code
+
+    def as_dict(self):
+        pct = lambda ratio: None if ratio is None else round(ratio * 100, 1)
+        return {"price": self.price, "change": self.change,
+                "GPM": pct(self.gpm), "OPM": pct(self.opm), "ROE": pct(self.roe)}
+
+    def render(self):
+        price = "N/A" if self.price is None else (f"{self.price:,.0f}" if self.domestic else f"${self.price:.2f}")
+        pct = lambda ratio: _fmt(None if ratio is None else ratio * 100, ".1f") + ("%" if ratio is not None else "")
+        return {
+            "price": price,
+            "change": _fmt(self.change or 0.0, "+.2f") + "%",
+            "GPM": pct(self.gpm),
+            "OPM": pct(self.opm),
+            "ROE": pct(self.roe),
+        }
+
+
+@dataclass(slots=True)
+class RiskSnapshot:
+    """[V16.5] EPU / VIX 롤링 Z, Vp(Slope), Ap(Accel) / GPR Proxy"""
+    epu: float | None = None
+    vix: float | None = None
+    vix_z: float | None = None
+    vix_slope: float | None = None
+    vix_accel: float | None = None
+    gpr: dict = field(default_factory=dict)
+    at: str | None = None
+
+    def as_dict(self):
+        return {"EPU": self.epu, "VIX": self.vix, "VIX_Z": self.vix_z, "VIX_Slope": self.vix_slope,
+                "VIX_Accel": self.vix_accel, "GPR_Proxy": self.gpr}
+
+    def render(self):
+        result = {"EPU": _fmt(self.epu, ".2f"), "VIX": _fmt(self.vix, ".2f"), "VIX_Z": _fmt(self.vix_z, ".2f", "0.0")}
+        if self.vix_slope is not None:
+            result["VIX_Slope"] = f"{self.vix_slope:.2f}"
+            result["VIX_Accel"] = _fmt(self.vix_accel, ".2f")
+        result["GPR_Proxy"] = self.gpr
+        return result
+
+
+@dataclass(slots=True)
+class ScanHit:
+    """[V16.31] 전 종목 스캔 결과 1건 (순매수는 억 원)"""
+    code: str
+    name: str
+    market: str
+    price: float
+    change: float
+    foreign: float
+    inst: float
+    score: int
+    at: str | None = None
+
+    def as_dict(self):
+        return {"code": self.code, "name": self.name, "price": self.price, "change": self.change,
+                "foreign": self.foreign, "inst": self.inst, "score": self.score}
+
+    def render(self):
+        return (f"{self.name}({self.code}) {self.price:,.0f} ({self.change:+.2f}%) "
+                f"| 외인 {self.foreign:+,.0f}억 기관 {self.inst:+,.0f}억 | {self.score}점")
+
+
+@dataclass(slots=True)
+class Disclosure:
+    """[V16.35] OpenDART 공시 1건 (date: 접수일 YYYYMMDD)"""
+    rcept_no: str
+    code: str
+    name: str
+    report: str
+    date: str
+    material: bool = False
+    at: str | None = None
+
+    @property
+    def url(self):
+        return f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={self.rcept_no}"
+
+    def as_dict(self):
+        return {"code": self.code, "name": self.name, "report": self.report, "date": self.date}
+
+    def render(self):
+        return f"{self.date[4:6]}/{self.date[6:8]} {self.name}({self.code}) {self.report}"
+
+
+RECORDS = {cls.__name__: cls for cls in (Quote, StockSnapshot, RiskSnapshot, ScanHit, Disclosure)}
+
+
+def is_record(value):
+    return isinstance(value, tuple(RECORDS.values()))
+
+
+def render(value):
+    """
+    리포트 출력 직전에만 호출: 레코드 -> 기존 표시 문자열 구조
+    (숫자는 천 단위 구분, 빈 종목은 'Data Unavailable')
+    """
+    if is_record(value):
+        return value.render()
+    if isinstance(value, dict):
+        return {k: ("Data Unavailable" if v is None else render(v)) for k, v in value.items()}
+    if isinstance(value, list):
+        return [render(v) for v in value]
+    if isinstance(value, float):
+        return f"{value:,.0f}" if value.is_integer() else f"{value:,.2f}"
+    return value
+
+
+def to_plain(value):
+    """JSON 저장용 (레코드는 {"__record__": 이름, ...필드})"""
+    if is_record(value):
+        plain = {f.name: to_plain(getattr(value, f.name)) for f in fields(value)}
+        plain["__record__"] = type(value).__name__
+        return plain
+    if isinstance(value, dict):
+        return {k: to_plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(v) for v in value]
+    return value
+
+
+def from_plain(value):
+    """to_plain의 역변환"""
+    if isinstance(value, dict):
+        value = {k: from_plain(v) for k, v in value.items()}
+        name = value.pop("__record__", None)
+        return RECORDS[name](**value) if name in RECORDS else value
+    if isinstance(value, list):
+        return [from_plain(v) for v in value]
+    return value
@@ -0,0 +1,156 @@
+# data/timeseries.py
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+import config
+
+
+class TimeSeriesStore:
+    """
+    [V16.17] 로컬 일봉 시계열 저장소 (SQLite)
+    - 심볼별 마지막 저장일 이후의 봉만 받아 append (매 실행 몇 줄만 다운로드)
+    - 리스크/매크로 계산은 로컬 디스크의 구간(window)을 읽어서 수행
+    - 마지막 저장일은 장중 미완성 봉일 수 있으므로 재수집 시 덮어씀
+    - [V16.33] 거래소 달력상 새 확정 봉이 없으면 요청 자체를 생략 (주말/휴장일 실행)
+    """
+    def __init__(self, path, fetch=None, initial_period="1y"):
+        self.path = path
+        self.initial_period = initial_period
+        self._fetch = fetch # (symbols, period=, start=) -> 종가 DataFrame
+        self._lock = threading.Lock()
+        self._refreshed = set() # 이번 실행에서 이미 갱신한 심볼
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS bars ("
+                " symbol TEXT NOT NULL, date TEXT NOT NULL, close REAL,"
+                " PRIMARY KEY (symbol, date))"
+            )
+            # 심볼별 마지막 수집 시각 (UTC) - 확정 봉까지 받았는지 판단용
+            conn.execute("CREATE TABLE IF NOT EXISTS fetched (symbol TEXT PRIMARY KEY, at TEXT)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn: # 정상 종료 시 commit, 예외 시 rollback
+                yield conn
+        finally:
+            conn.close()
+
+    def reset(self):
+        """새 실행 시작 시 갱신 기록 초기화"""
+        with self._lock:
+            self._refreshed = set()
+
+    def last_date(self, symbol):
+        with self._connect() as conn:
+            row = conn.execute("SELECT MAX(date) FROM bars WHERE symbol = ?", (symbol,)).fetchone()
+        return row[0] if row else None
+
+    def fetched_at(self, symbol):
+        with self._connect() as conn:
+            row = conn.execute("SELECT at FROM fetched WHERE symbol = ?", (symbol,)).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def _mark_fetched(self, symbols):
+        at = datetime.now(timezone.utc).isoformat()
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO fetched (symbol, at) VALUES (?, ?)", [(s, at) for s in symbols])
+
+    @staticmethod
+    def _settled(symbol, last, fetched):
+        """
+        [V16.33] 거래소 달력상 마지막 확정 봉까지 이미 받았으면 True (장 마감 이후 수집했고 새 영업일이 없음)
+        - FX/선물/코인처럼 달력이 없는 심볼은 항상 False
+        """
+        from data.sessions import calendar_for, get_calendar
+        name = calendar_for(symbol)
+        if name is None or fetched is None:
+            return False
+        calendar = get_calendar(name)
+        completed = calendar.last_completed()
+        if completed is None or last < completed.isoformat():
+            return False
+        return fetched >= calendar.closed_at(completed) + timedelta(minutes=config.CALENDAR_SETTLE_MIN)
+
+    def append(self, symbol, closes):
+        """종가 Series(index=날짜) 저장 (같은 날짜는 덮어씀)"""
+        closes = closes.dropna()
+        if closes.empty:
+            return 0
+        rows = [(symbol, pd.Timestamp(d).strftime("%Y-%m-%d"), float(v)) for d, v in closes.items()]
+        with self._connect() as conn:
+            conn.executemany("INSERT OR REPLACE INTO bars (symbol, date, close) VALUES (?, ?, ?)", rows)
+        return len(rows)
+
+    def refresh(self, symbols):
+        """
+        심볼들을 증분 갱신
+        - 처음 보는 심볼: initial_period 만큼 한 번에 수집
+        - 기존 심볼: 가장 오래된 '마지막 저장일'부터 한 번에 수집
+        """
+        with self._lock:
+            pending = [s for s in dict.fromkeys(symbols) if s not in self._refreshed]
+            if not pending:
+                return
+
+            last = {s: self.last_date(s) for s in pending}
+            new = [s for s in pending if last[s] is None]
+            known = [s for s in pending if last[s] is not None and not self._settled(s, last[s], self.fetched_at(s))]
+
+            batches = []
+            if new:
+                batches.append((new, {"period": self.initial_period}))
+            if known:
+                batches.append((known, {"start": min(last[s] for s in known)}))
+
+            for batch, span in batches:
+                frame = self._fetch(batch, **span)
+                for symbol in batch:
+                    if symbol in frame:
+                        self.append(symbol, frame[symbol])
+                self._mark_fetched([symbol for symbol in batch if symbol in frame])
+            self._refreshed.update(pending)
+
+    def backfill(self, symbols, period):
+        """과거 구간 일괄 보충 (백테스트용 장기 이력, 기존 날짜는 덮어씀)"""
+        with self._lock:
+            frame = self._fetch(list(symbols), period=period)
+            for symbol in symbols:
+                if symbol in frame:
+                    self.append(symbol, frame[symbol])
+
+    def window(self, symbol, days=None):
+        """최근 days일(달력 기준) 종가 Series (index=DatetimeIndex)"""
+        query = "SELECT date, close FROM bars WHERE symbol = ?"
+        params = [symbol]
+        if days:
+            query += " AND date >= ?"
+            params.append((datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d"))
+        query += " ORDER BY date"
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        series = pd.Series([r[1] for r in rows], index=pd.to_datetime([r[0] for r in rows]), name=symbol, dtype=float)
+        series.index.name = "Date"
+        return series
+
+    def frame(self, symbols, days=None):
+        """여러 심볼의 종가 DataFrame (columns=심볼, 날짜 outer join)"""
+        return pd.concat({s: self.window(s, days) for s in symbols}, axis=1)
+
+
+def open_timeseries_store():
+    """config 기반 공용 시계열 저장소 (yfinance 배치 다운로드 사용)"""
+    from engines.prices import download_closes
+    return TimeSeriesStore(
+        os.path.join(config.CACHE_DIR, "timeseries.db"),
+        fetch=download_closes,
+        initial_period=config.TIMESERIES_INITIAL_PERIOD,
+    )
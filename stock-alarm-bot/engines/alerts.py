@@ -0,0 +1,218 @@
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+
+import config
+from engines import health, risk
+from engines.profiler import Profiler, profiler
+
+
+class Rule:
+    """
+    임계값 규칙 (히스테리시스 포함)
+    - above: 값이 above 이상이면 발동, above - hysteresis 아래로 내려가야 해제
+    - below: 값이 below 이하이면 발동, below + hysteresis 위로 올라가야 해제
+    - 해제되기 전까지는 다시 발동하지 않음 (경계선 근처 진동 시 스팸 방지)
+    """
+    def __init__(self, name, metric, above=None, below=None, hysteresis=0.0):
+        self.name = name
+        self.metric = metric
+        self.above = above
+        self.below = below
+        self.hysteresis = hysteresis
+
+    def triggered(self, value):
+        return (self.above is not None and value >= self.above) or \
+               (self.below is not None and value <= self.below)
+
+    def cleared(self, value):
+        above_ok = self.above is None or value < self.above - self.hysteresis
+        below_ok = self.below is None or value > self.below + self.hysteresis
+        return above_ok and below_ok
+
+    def describe(self, value):
+        if self.above is not None and value >= self.above:
+            return f"{self.metric} {value:,.2f} ≥ {self.above:,.2f}"
+        return f"{self.metric} {value:,.2f} ≤ {self.below:,.2f}"
+
+
+def default_rules():
+    """config 기반 기본 규칙 + 종목별 등락률 규칙"""
+    rules = [Rule(**spec) for spec in config.ALERT_RULES]
+    names = {}
+    for group in (config.MACRO_TICKERS, config.SAFE_HAVEN_TICKERS):
+        names.update({code: name for name, code in group.items()})
+    for tickers in config.SECTORS.values():
+        names.update(tickers)
+    for code, name in names.items():
+        rules.append(Rule(f"{name} 급변", f"chg:{code}", above=config.ALERT_MOVE_PCT,
+                          below=-config.ALERT_MOVE_PCT, hysteresis=config.ALERT_MOVE_PCT / 3))
+    return rules
+
+
+class VixState:
+    """
+    VIX 실시간 Z / Slope 계산용 상태
+    - 하루 한 번 저장소의 확정 일봉 최근 window-1개와 전일 Z를 준비해 두고
+      매 틱에는 현재 VIX를 더한 window개로 Z, Slope만 갱신 (전체 재계산 없음)
+    - 현재 값을 윈도우에 포함 -> risk.rolling_metrics의 일별 Z와 같은 정의 (리포트 Z와 동일 척도)
+    """
+    def __init__(self, store, window=None):
+        self.store = store
+        self.window = window or config.RISK_WINDOW
+        self.day = None
+        self.base = self.prev_z = None
+
+    def _rebase(self, today):
+        self.store.reset()
+        self.store.refresh(["^VIX"])
+        history = self.store.window("^VIX", days=config.RISK_LOOKBACK_DAYS)
+        history = history[history.index.date < today] # 오늘 미완성 봉 제외
+        self.base = history.iloc[-(self.window - 1):].to_numpy(dtype=float) if self.window > 1 else np.array([])
+        current = risk.latest(risk.rolling_metrics(history, self.window))
+        self.prev_z = float(current["Z"]) if current is not None else None
+        self.day = today
+
+    def update(self, vix_now):
+        today = datetime.now().date()
+        if self.day != today:
+            self._rebase(today)
+        if self.prev_z is None or len(self.base) < self.window - 1:
+            return None, None
+        values = np.append(self.base, vix_now)
+        std = values.std(ddof=1) # pandas rolling().std()와 같은 표본 표준편차
+        if not np.isfinite(std) or std == 0:
+            return None, None
+        z = (vix_now - values.mean()) / std
+        return z, z - self.prev_z
+
+
+class Watcher:
+    """
+    [V16.25] 장중 임계값 알림 엔진
+    - 짧은 주기로 감시 대상 전 종목 시세를 한 번에 받아 규칙을 증분 평가
+    - 규칙별 발동/해제 상태(히스테리시스) + 쿨다운으로 중복 알림 방지
+    - 상태는 파일로 저장되어 재시작해도 같은 알림을 다시 보내지 않음
+    """
+    def __init__(self, send, rules=None, store=None, pulse=None, state_path=None, fetch=None):
+        self.send = send
+        self.rules = rules or default_rules()
+        # 최신 Pulse Score 제공 함수 (SNR 계산용, 기본: 저장소의 마지막 일별 Pulse)
+        self.pulse = pulse or (lambda: self._stored_pulse(store))
+        self.state_path = state_path or os.path.join(config.CACHE_DIR, "alerts.json")
+        self.cooldown = config.ALERT_COOLDOWN_MIN * 60
+        self._fetch = fetch
+        self._lock = threading.Lock()
+        self.vix = VixState(store) if store is not None else None
+        self.state = self._load()
+        # 30초 폴링의 HTTP 기록은 감시 전용 프로파일러/소스 상태에 (리포트 요약/health.json과 분리)
+        self.profiler = Profiler()
+        self.health = health.HealthRegistry(None)
+
+    @staticmethod
+    def _stored_pulse(store):
+        if store is None:
+            return 0.0
+        history = store.window(config.PULSE_SERIES, days=7)
+        return float(history.iloc[-1]) if not history.empty else 0.0
+
+    def _load(self):
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        tmp = self.state_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.state, f, ensure_ascii=False)
+        os.replace(tmp, self.state_path)
+
+    def symbols(self):
+        symbols = list(config.MACRO_TICKERS.values()) + list(config.SAFE_HAVEN_TICKERS.values())
+        symbols += [code for tickers in config.SECTORS.values() for code in tickers]
+        return symbols + ["^VIX"]
+
+    def metrics(self):
+        """현재 지표 스냅샷 {metric: value} (배치 시세 1회 요청)"""
+        self.profiler.reset() # 틱마다 새로 기록 (상주 중 무한히 쌓이지 않도록)
+        with profiler.redirect(self.profiler), health.use(self.health):
+            return self._metrics()
+
+    def _metrics(self):
+        from engines.prices import download_closes, quote_frame
+        fetch = self._fetch or download_closes
+        quotes = quote_frame(fetch(self.symbols(), period="5d"))
+
+        values = {}
+        for code, row in quotes.iterrows():
+            if row["price"] == row["price"]: # NaN 제외
+                values[code] = float(row["price"])
+            if row["change"] == row["change"]:
+                values[f"chg:{code}"] = float(row["change"])
+        for name, code in config.MACRO_TICKERS.items():
+            if code in values:
+                values[name] = values[code]
+
+        if self.vix is not None and "^VIX" in values:
+            z, slope = self.vix.update(values["^VIX"])
+            if z is not None:
+                values["VIX_Z"] = z
+                values["VIX_Slope"] = slope
+                values["SNR"] = float(risk.snr(self.pulse(), slope))
+        return values
+
+    def evaluate(self, values, now=None):
+        """규칙 증분 평가 -> 이번에 보낼 알림 문구 리스트"""
+        now = now or time.time()
+        alerts = []
+        for rule in self.rules:
+            value = values.get(rule.metric)
+            if value is None:
+                continue
+            entry = self.state.setdefault(rule.name, {"active": False, "last_sent": 0})
+            if not entry["active"] and rule.triggered(value):
+                entry["active"] = True
+                if now - entry["last_sent"] >= self.cooldown:
+                    entry["last_sent"] = now
+                    alerts.append(f"🚨 {rule.name}: {rule.describe(value)}")
+            elif entry["active"] and rule.cleared(value):
+                entry["active"] = False
+                logging.info(f"🔕 알림 해제: {rule.name} ({rule.metric} {value:,.2f})")
+        return alerts
+
+    def tick(self):
+        """1회 폴링 (실패해도 다음 틱에서 계속)"""
+        with self._lock:
+            try:
+                alerts = self.evaluate(self.metrics())
+            except Exception as e:
+                logging.error(f"❌ 알림 감시 실패: {e}")
+                return []
+            if alerts:
+                stamp = datetime.now().strftime("%H:%M:%S")
+                self.send(f"⚡ **[Market-Eye Alert]** {stamp}\n" + "\n".join(alerts))
+            self._save()
+            return alerts
+
+    def run_forever(self, interval=None):
+        interval = interval or config.ALERT_POLL_SEC
+        while True:
+            started = time.monotonic()
+            self.tick()
+            time.sleep(max(interval - (time.monotonic() - started), 1))
+
+
+if __name__ == "__main__":
+    # 단독 실행: python -m engines.alerts
+    from data.timeseries import open_timeseries_store
+    from notifiers.telegram_bot import send_message
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+    Watcher(send_message, store=open_timeseries_store()).run_forever()
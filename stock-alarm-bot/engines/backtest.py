@@ -0,0 +1,128 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+import config
+from engines import risk
+
+
+def align_inputs(vix, pulse, fx, target):
+    """
+    일봉 입력 정렬 (VIX 거래일 기준)
+    - Pulse: 기록이 없는 날은 직전 값 유지, 그 이전은 0 (SNR 계산 시 floor 적용)
+    - FX/대상 지수: 휴장일 차이는 직전 값으로 채움
+    """
+    frame = pd.DataFrame({"vix": vix}).dropna()
+    frame["pulse"] = pulse.reindex(frame.index, method="ffill").fillna(0.0) if pulse is not None else 0.0
+    frame["fx"] = fx.reindex(frame.index, method="ffill")
+    frame["target"] = target.reindex(frame.index, method="ffill")
+    return frame
+
+
+def signal_states(snr, accel, fx, gate, crisis_level=None, noise_level=None):
+    """
+    Brain 규칙과 동일한 신호 판정 (브로드캐스팅 지원)
+    - -1 (EVACUATE): SNR > crisis_level 또는 USD/KRW > gate (Iron Rule)
+    - +1 (BE GREEDY): SNR < noise_level 이고 Ap < 0 (공포 감속), 게이트 통과
+    -  0 (HOLD): 그 외
+    """
+    crisis_level = crisis_level if crisis_level is not None else config.SNR_CRISIS_LEVEL
+    noise_level = noise_level if noise_level is not None else config.SNR_NOISE_LEVEL
+    gated = fx > gate
+    evacuate = (snr > crisis_level) | gated
+    greedy = (snr < noise_level) & (accel < 0) & ~gated
+    return np.where(evacuate, -1, np.where(greedy, 1, 0))
+
+
+def timeline(frame, window=None, noise_sigma=None, gate=None):
+    """단일 파라미터 조합의 신호 타임라인 (날짜별 Z/Slope/Accel/SNR/state)"""
+    gate = gate if gate is not None else config.FX_GATE
+    metrics = risk.rolling_metrics(frame["vix"], window)
+    out = frame.join(metrics[["Z", "Slope", "Accel"]])
+    out["snr"] = risk.snr(out["pulse"], out["Slope"], noise_sigma)
+    out["state"] = signal_states(out["snr"].to_numpy(), out["Accel"].to_numpy(), out["fx"].to_numpy(), gate)
+    out.loc[out["Slope"].isna(), "state"] = 0
+    return out
+
+
+def sweep(frame, windows, sigmas, gates, horizon=5):
+    """
+    [V16.19] SNR / Panic 모델 파라미터 스윕 (완전 벡터화)
+    - windows x sigmas x gates 전 조합을 (W, S, G, T) 배열 한 번으로 평가
+    - 신호 다음 horizon 거래일 대상 지수 수익률로 적중률/평균 수익률 산출
+    - 전략 수익률: EVACUATE 상태일 때만 현금, 그 외 보유 (신호 다음날부터 반영)
+    - 반환: index=(window, noise_sigma, gate) 통계 DataFrame
+    """
+    windows, sigmas, gates = list(windows), np.asarray(sigmas, float), np.asarray(gates, float)
+
+    metrics = [risk.rolling_metrics(frame["vix"], w) for w in windows]
+    slope = np.vstack([m["Slope"].to_numpy() for m in metrics])
+    accel = np.vstack([m["Accel"].to_numpy() for m in metrics])
+    pulse = frame["pulse"].to_numpy()
+    fx = frame["fx"].to_numpy()
+    target = frame["target"].to_numpy()
+
+    # (W, S, 1, T)
+    snr = risk.snr(pulse[None, None, None, :], slope[:, None, None, :], sigmas[None, :, None, None])
+    # (1, 1, G, T) 게이트와 브로드캐스팅 -> (W, S, G, T)
+    states = signal_states(snr, accel[:, None, None, :], fx[None, None, None, :], gates[None, None, :, None])
+    states = np.where(np.isnan(slope)[:, None, None, :], 0, states)
+
+    fwd = pd.Series(target).shift(-horizon).to_numpy() / target - 1 # 신호일 기준 horizon 선행 수익률
+    daily = np.append(target[1:] / target[:-1] - 1, np.nan)         # 다음 거래일 수익률
+    valid = ~np.isnan(fwd)
+
+    buy = (states == 1) & valid
+    exit_ = (states == -1) & valid
+
+    def masked_mean(values, mask):
+        n = mask.sum(axis=-1)
+        total = np.where(mask, values, 0.0).sum(axis=-1)
+        return np.where(n > 0, total / np.maximum(n, 1), np.nan)
+
+    held = np.where(states == -1, 0.0, 1.0)
+    strategy = np.nansum(np.log1p(held * np.nan_to_num(daily)), axis=-1)
+    buy_hold = np.nansum(np.log1p(np.nan_to_num(daily)))
+
+    stats = {
+        "buy_signals": buy.sum(axis=-1),
+        "buy_hit_rate": masked_mean(fwd > 0, buy),
+        "buy_avg_return": masked_mean(fwd, buy),
+        "exit_signals": exit_.sum(axis=-1),
+        "exit_hit_rate": masked_mean(fwd < 0, exit_),
+        "exit_avg_return": masked_mean(fwd, exit_),
+        "days_in_cash": (states == -1).sum(axis=-1),
+        "strategy_return": np.expm1(strategy),
+        "buy_hold_return": np.full(states.shape[:-1], np.expm1(buy_hold)),
+    }
+    index = pd.MultiIndex.from_tuples(list(itertools.product(windows, sigmas, gates)),
+                                      names=["window", "noise_sigma", "gate"])
+    return pd.DataFrame({k: np.asarray(v, float).reshape(-1) for k, v in stats.items()}, index=index)
+
+
+def load_inputs(store, backfill=None):
+    """로컬 시계열 저장소에서 백테스트 입력 로드 (backfill 기간이 주어지면 먼저 보충)"""
+    symbols = ["^VIX", config.MACRO_TICKERS["USD/KRW"], config.BACKTEST_TARGET]
+    if backfill:
+        store.backfill(symbols, backfill)
+    return align_inputs(
+        store.window("^VIX"),
+        store.window(config.PULSE_SERIES),
+        store.window(config.MACRO_TICKERS["USD/KRW"]),
+        store.window(config.BACKTEST_TARGET),
+    )
+
+
+if __name__ == "__main__":
+    # 사용법: python -m engines.backtest [백필 기간, 예: 10y]
+    import sys
+    from data.timeseries import open_timeseries_store
+
+    frame = load_inputs(open_timeseries_store(), backfill=sys.argv[1] if len(sys.argv) > 1 else None)
+    print(f"📼 Backtest 입력: {len(frame)}일 ({frame.index.min():%Y-%m-%d} ~ {frame.index.max():%Y-%m-%d})")
+
+    result = sweep(frame, config.BACKTEST_WINDOWS, config.BACKTEST_SIGMAS, config.BACKTEST_GATES,
+                   horizon=config.BACKTEST_HORIZON)
+    with pd.option_context("display.width", 200, "display.max_rows", 50):
+        print(result.sort_values("strategy_return", ascending=False).head(20))
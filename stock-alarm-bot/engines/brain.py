@@ -1,6 +1,56 @@
 import google.generativeai as genai
 import config
-import json
+import os
+import re
+import time
+from datetime import datetime
+from data.cache import TTLCache
+from engines import health
+from engines import prompt as compact_prompt
+from engines.profiler import span
+
+# 리포트 섹션 머리 (1️⃣ Macro, 2️⃣ Players, ...)
+_SECTION = re.compile(r"^[ \t]*\**[ \t]*[0-9]\ufe0f?\u20e3", re.M)
+
+
+class SectionBuffer:
+    """
+    [V16.27] 스트리밍 응답을 섹션 단위로 끊어 전달
+    - 다음 섹션 머리가 도착하면 직전 섹션이 완성된 것으로 보고 emit
+    - 첫 섹션 앞의 제목/날짜는 첫 섹션과 함께 전달
+    """
+    def __init__(self, emit):
+        self.emit = emit
+        self.text = ""
+        self.sections = 0
+
+    def feed(self, chunk):
+        self.text += chunk
+        while True:
+            heads = [m.start() for m in _SECTION.finditer(self.text)]
+            if len(heads) < 2:
+                return
+            self._emit(self.text[:heads[1]])
+            self.text = self.text[heads[1]:]
+
+    def flush(self):
+        self._emit(self.text)
+        self.text = ""
+
+    def _emit(self, section):
+        if section.strip():
+            self.sections += 1
+            self.emit(section.strip())
+
+
+def split_sections(text):
+    """완성된 리포트를 섹션 리스트로 (캐시된 응답을 스트리밍 경로로 보낼 때)"""
+    sections = []
+    buffer = SectionBuffer(sections.append)
+    buffer.feed(text)
+    buffer.flush()
+    return sections
+
 
 class Brain:
     """
@@ -15,28 +65,103 @@ class Brain:
         # 'gemini-pro' alias might be deprecated or unstable.
         # Switching to 'gemini-1.5-flash' for speed/stability/math capabilities.
         self.model = genai.GenerativeModel('gemini-1.5-flash')
+        # [V16.26] 응답 캐시 (입력 내용 해시 -> 분석 결과) + 직전 브리핑
+        self.responses = TTLCache(os.path.join(config.CACHE_DIR, "brain.json"),
+                                  default_ttl=config.BRAIN_CACHE_TTL, max_entries=200)
 
-    def analyze_market(self, market_data):
+    def analyze_market(self, market_data, on_section=None):
         """
         데이터를 분석하여 리포트 텍스트 생성
+        - 같은 입력(내용 해시) 또는 직전 브리핑 대비 임계값 이상 바뀐 값이 없으면 이전 분석 재사용
+        - [V16.27] on_section이 주어지면 스트리밍 생성, 섹션이 완성될 때마다 on_section(text) 호출
+          (반환값은 항상 전체 리포트, 생성 중 오류는 호출부로 전달 -> 이미 보낸 섹션 뒤에 기본 리포트로 대체)
         """
         if not market_data:
             return "❌ 데이터가 없어 분석할 수 없습니다."
 
-        prompt = self._create_prompt(market_data)
+        snapshot = compact_prompt.compact(market_data)
+        key = compact_prompt.digest(snapshot)
+        last = self.responses.get_many("last", ("snapshot", "response", "at"))
+
+        cached = self.responses.get(key, "response")
+        if cached is None and last is not None and not compact_prompt.changes(snapshot, last["snapshot"]):
+            cached = last["response"]
+        if cached is not None:
+            print("🧠 Brain: 입력 변화 없음 -> 이전 분석 재사용")
+            for section in split_sections(cached) if on_section else ():
+                on_section(section)
+            return cached
+
+        previous = last if last is not None and self._delta_usable(last["at"]) else None
+        prompt = self._create_prompt(snapshot, previous)
         
         try:
-            response = self.model.generate_content(prompt)
-            return response.text
+            with health.guard("gemini"), span("llm", "Brain.analyze_market", prompt_chars=len(prompt), delta=previous is not None) as rec:
+                if on_section is None:
+                    text = self.model.generate_content(prompt).text
+                else:
+                    text = self._stream(prompt, on_section, rec)
+                rec["response_chars"] = len(text)
         except Exception as e:
+            if on_section is not None:
+                raise
             return f"❌ AI 분석 중 에러 발생: {str(e)}"
 
-    def _create_prompt(self, data):
+        self.responses.set(key, "response", text)
+        self.responses.set_many("last", {
+            "snapshot": snapshot,
+            "response": text,
+            "at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        })
+        try:
+            self.responses.save()
+        except Exception as e:
+            print(f"    ⚠️ Brain 캐시 저장 실패: {e}")
+        return text
+
+    def _stream(self, prompt, on_section, rec):
+        """스트리밍 생성 -> 섹션 단위 전달, 전체 텍스트 반환 (첫 섹션 도착 시각은 span에 기록)"""
+        started = time.perf_counter()
+
+        def emit(section):
+            rec.setdefault("first_section", round(time.perf_counter() - started, 3))
+            on_section(section)
+
+        buffer = SectionBuffer(emit)
+        parts = []
+        for chunk in self.model.generate_content(prompt, stream=True):
+            parts.append(chunk.text)
+            buffer.feed(chunk.text)
+        buffer.flush()
+        rec["sections"] = buffer.sections
+        return "".join(parts)
+
+    @staticmethod
+    def _delta_usable(at):
+        """직전 브리핑이 같은 날 + PROMPT_DELTA_MAX_AGE 이내일 때만 변화분 프롬프트 사용"""
+        previous = datetime.strptime(at, "%Y-%m-%d %H:%M:%S")
+        now = datetime.now()
+        return previous.date() == now.date() and (now - previous).total_seconds() <= config.PROMPT_DELTA_MAX_AGE
+
+    def _data_block(self, snapshot, previous):
+        """[Data Provided] 본문: 전체 스냅샷 또는 (직전 브리핑 + 변화분)"""
+        if previous is None:
+            return compact_prompt.dumps(snapshot)
+        delta = compact_prompt.changes(snapshot, previous["snapshot"])
+        return (
+            f"Previous briefing ({previous['at']}):\n{previous['response']}\n\n"
+            f"Changes since then (only fields that moved beyond threshold; null = no longer available; everything else is unchanged):\n"
+            f"{compact_prompt.dumps(delta)}\n"
+            f"Now: {snapshot.get('timestamp', '')}. Rewrite the full briefing in the same format, updating what the changes affect."
+        )
+
+    def _create_prompt(self, data, previous=None):
         """
         프롬프트 엔지니어링 V16.9 (Panic Acceleration Model)
         - VIX Accel ($A_p$): 공포의 2차 미분값으로 '반등의 질' 판단
         - Contrarian: $A_p < 0$ (감속) 시 과감한 역발상 매수
         - Final Override: 환율 1420원 돌파 시 모든 논리 무시하고 '현금'
+        - [V16.26] data는 compact 스냅샷 (시세는 [가격, 등락률%]), previous가 있으면 변화분만 전달
         """
         system_role = config.SYSTEM_ROLE if hasattr(config, 'SYSTEM_ROLE') else ""
         safe_havens = config.SAFE_HAVEN_TICKERS if hasattr(config, 'SAFE_HAVEN_TICKERS') else {}
@@ -51,10 +176,10 @@ class Brain:
         - **Language**: Korean (한국어).
 
         [Data Provided]
-        {json.dumps(data, indent=2, ensure_ascii=False)}
+        {self._data_block(data, previous)}
         
         [Safe Haven Tickers]
-        {json.dumps(safe_havens, indent=2, ensure_ascii=False)}
+        {compact_prompt.dumps(safe_havens)}
 
         [Hybrid Latency Filter & Analysis Rules (V16.9)]
 
@@ -113,4 +238,6 @@ class Brain:
         - **🛡️ K-Heavy**: {{Analysis}}
         - **💄 K-Culture**: {{Analysis}}
         - **🚗 모빌리티**: {{Analysis}}
+        - **🔭 Universe Scan**: Top picks from 'universe' (score = Foreign +40 / Inst +30 / Price-up +30), if provided.
+        - **📑 Disclosures**: Flag material DART filings from 'disclosures' for the watched names, if provided.
         """
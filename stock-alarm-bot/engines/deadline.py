@@ -0,0 +1,48 @@
+import threading
+import time
+from concurrent.futures import Future, TimeoutError
+
+
+def spawn(func, name=None):
+    """
+    func를 데몬 스레드에서 실행하고 Future 반환
+    - 예산 초과로 버려진 작업이 프로세스 종료(리포트 전송 후)를 붙잡지 않도록 데몬 스레드 사용
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=name, daemon=True).start()
+    return future
+
+
+class Deadline:
+    """
+    [V16.22] 실행 단위 마감 시각
+    - 전체 마감(총 예산)과 개별 예산 중 먼저 오는 쪽으로 남은 시간 계산
+    """
+    def __init__(self, seconds):
+        self.start = time.monotonic()
+        self.at = self.start + seconds
+
+    def remaining(self, budget=None):
+        """남은 시간(초, 0 이상). budget이 주어지면 시작 시점 기준 개별 예산과 비교"""
+        end = self.at if budget is None else min(self.at, self.start + budget)
+        return max(end - time.monotonic(), 0.0)
+
+    def expired(self):
+        return time.monotonic() >= self.at
+
+
+def run_with_timeout(func, timeout, name=None):
+    """timeout 안에 끝나면 결과 반환, 넘기면 TimeoutError (작업은 백그라운드에서 버려짐)"""
+    return spawn(func, name).result(timeout=timeout)
+
+
+__all__ = ["Deadline", "TimeoutError", "run_with_timeout", "spawn"]
@@ -0,0 +1,189 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import config
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpen(Exception):
+    """차단기가 열린 소스 호출 (요청 없이 즉시 실패 -> 호출부의 캐시/저장 값 경로로)"""
+
+
+class Call:
+    """guard() 안에서 예외 없이 끝났지만 실패로 봐야 하는 응답(403, 빈 결과 등) 표시용"""
+    def __init__(self):
+        self.error = None
+
+    def fail(self, reason):
+        self.error = reason
+
+
+class HealthRegistry:
+    """
+    [V16.36] 업스트림 소스별 상태 + 차단기 (Circuit Breaker)
+    - 소스별 성공률/지연시간 EWMA, 연속 실패 횟수 기록
+    - 연속 HEALTH_FAILURE_THRESHOLD회 실패 -> open: 쿨다운 동안 호출 즉시 CircuitOpen
+    - 쿨다운 경과 후 첫 호출 1건만 half_open 시험 호출 -> 성공이면 closed, 실패면 쿨다운 2배로 다시 open
+    - JSON 파일로 저장되어 실행(프로세스) 간 유지 (죽은 소스를 매 실행 처음부터 다시 두드리지 않음)
+    """
+    def __init__(self, path, threshold=None, cooldown=None, max_cooldown=None, alpha=None):
+        self.path = path
+        self.threshold = threshold or config.HEALTH_FAILURE_THRESHOLD
+        self.cooldown = cooldown or config.HEALTH_OPEN_SEC
+        self.max_cooldown = max_cooldown or config.HEALTH_OPEN_MAX_SEC
+        self.alpha = alpha or config.HEALTH_EWMA_ALPHA
+        self._lock = threading.Lock()
+        self._probing = set() # half_open 시험 호출 중인 소스
+        self.sources = self._load()
+
+    def _load(self):
+        if self.path is None:
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        if self.path is None: # 저장하지 않는 (프로세스 내) 레지스트리
+            return
+        with self._lock:
+            payload = json.dumps(self.sources, ensure_ascii=False, indent=2)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, self.path)
+
+    def _state(self, source):
+        return self.sources.setdefault(source, {
+            "state": CLOSED, "failures": 0, "opened_at": 0.0, "cooldown": self.cooldown,
+            "ok_rate": 1.0, "latency": 0.0, "calls": 0, "last_error": None, "last_ok": None,
+        })
+
+    def allow(self, source, now=None):
+        """호출 허용 여부 (open 쿨다운이 지났으면 이 호출을 half_open 시험 호출로 허용)"""
+        now = now or time.time()
+        with self._lock:
+            state = self._state(source)
+            if state["state"] == CLOSED:
+                return True
+            if source in self._probing:
+                return False
+            if state["state"] == OPEN and now - state["opened_at"] < state["cooldown"]:
+                return False
+            state["state"] = HALF_OPEN
+            self._probing.add(source)
+            return True
+
+    def record(self, source, ok, latency, error=None, now=None):
+        now = now or time.time()
+        with self._lock:
+            state = self._state(source)
+            self._probing.discard(source)
+            state["calls"] += 1
+            state["ok_rate"] += self.alpha * ((1.0 if ok else 0.0) - state["ok_rate"])
+            state["latency"] += self.alpha * (latency - state["latency"])
+            if ok:
+                state.update(state=CLOSED, failures=0, cooldown=self.cooldown,
+                             last_ok=datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S"))
+                return
+            state["failures"] += 1
+            state["last_error"] = str(error)[:200] if error is not None else None
+            if state["state"] == HALF_OPEN:
+                state.update(state=OPEN, opened_at=now, cooldown=min(state["cooldown"] * 2, self.max_cooldown))
+            elif state["failures"] >= self.threshold:
+                state.update(state=OPEN, opened_at=now)
+
+    @contextmanager
+    def guard(self, source):
+        """
+        with health.guard("krx") as call:
+            df = stock.get_...()
+            if df.empty: call.fail("empty")
+        - source가 None이면 기록 없이 통과 (추적 대상이 아닌 호스트)
+        - 차단기가 열려 있으면 본문을 실행하지 않고 CircuitOpen
+        """
+        if source is None:
+            yield Call()
+            return
+        if not self.allow(source):
+            raise CircuitOpen(f"{source} 차단 중 (연속 실패)")
+        call = Call()
+        start = time.perf_counter()
+        try:
+            yield call
+        except BaseException as e:
+            self.record(source, False, time.perf_counter() - start, f"{type(e).__name__}: {e}")
+            raise
+        self.record(source, call.error is None, time.perf_counter() - start, call.error)
+
+    def source_for(self, host):
+        """transport 호스트 -> 소스 이름 (추적 대상이 아니면 None)"""
+        return config.HEALTH_HOSTS.get(host)
+
+    def summary_line(self, now=None):
+        """리포트 하단 한 줄: 정상 소스 수 + 차단/불안정 소스"""
+        now = now or time.time()
+        with self._lock:
+            sources = {name: dict(state) for name, state in self.sources.items()}
+        if not sources:
+            return ""
+        issues = []
+        for name, state in sorted(sources.items()):
+            if state["state"] != CLOSED:
+                retry = datetime.fromtimestamp(state["opened_at"] + state["cooldown"]).strftime("%H:%M")
+                issues.append(f"⛔ {name} 차단(재시도 {retry})")
+            elif state["ok_rate"] < config.HEALTH_WARN_RATE:
+                issues.append(f"⚠️ {name} {state['ok_rate']:.0%} {state['latency']:.1f}s")
+        healthy = sum(1 for state in sources.values() if state["state"] == CLOSED)
+        return " | ".join([f"🩺 Sources {healthy}/{len(sources)} OK"] + issues)
+
+
+_registry = None
+_registry_lock = threading.Lock()
+_local = threading.local() # 스레드별 레지스트리 (use)
+
+
+def get_registry():
+    """프로세스 공용 HealthRegistry 싱글톤 (CACHE_DIR/health.json, use() 중인 스레드는 해당 레지스트리)"""
+    override = getattr(_local, "registry", None)
+    if override is not None:
+        return override
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = HealthRegistry(os.path.join(config.CACHE_DIR, "health.json"))
+        return _registry
+
+
+def reset_registry(path=None):
+    """
+    공용 레지스트리를 빈 상태로 교체 (벤치마크/재생 실행마다 이전 실행의 차단 상태가 섞이지 않도록)
+    - path가 None이면 파일에 저장하지 않음
+    """
+    global _registry
+    with _registry_lock:
+        _registry = HealthRegistry(path)
+        return _registry
+
+
+@contextmanager
+def use(registry):
+    """현재 스레드의 호출을 registry에 기록 (공용 상태/리포트 요약과 분리)"""
+    previous = getattr(_local, "registry", None)
+    _local.registry = registry
+    try:
+        yield registry
+    finally:
+        _local.registry = previous
+
+
+def guard(source):
+    return get_registry().guard(source)
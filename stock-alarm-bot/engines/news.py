@@ -0,0 +1,103 @@
+import re
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+
+from engines import parsing, transport
+
+
+class NewsSearch:
+    """
+    [V16.13] 네이버 뉴스 검색 공용 계층
+    - 한 번의 실행(run) 안에서 키워드당 1회만 요청/파싱하고 결과를 공유
+    - GPR Proxy, Pulse Score, 정책 뉴스가 같은 결과를 읽음 (계엄/탄핵 등 중복 요청 제거)
+    - [V16.34] index(data/articles.py)가 있으면 색인에 없는 (처음 본) 기사만 fresh()로 제공
+    """
+    BASE_URL = "https://search.naver.com/search.naver?where=news&sort=1&query="
+
+    def __init__(self, headers, index=None):
+        self.headers = headers
+        self.index = index
+        self._lock = threading.Lock()
+        self._results = {} # keyword -> Future (동시 요청 시에도 1회만 fetch)
+        self._fresh = {} # keyword -> 이번 실행에서 처음 본 기사
+
+    def reset(self):
+        """새 실행 시작 시 이전 결과 폐기"""
+        with self._lock:
+            self._results = {}
+            self._fresh = {}
+
+    def search(self, keyword):
+        """
+        키워드 검색 결과 아이템 리스트 반환
+        - [{"title", "link", "time"}, ...] (최신순)
+        - 요청 실패 시 None (결과 없음 []과 구분)
+        """
+        with self._lock:
+            future = self._results.get(keyword)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._results[keyword] = future
+
+        if owner:
+            items = self._fetch(keyword)
+            fresh = []
+            if items and self.index is not None:
+                try:
+                    fresh = self.index.observe(keyword, items)
+                except Exception as e:
+                    print(f"    ⚠️ 기사 색인 실패 ({keyword}): {e}")
+            with self._lock:
+                self._fresh[keyword] = fresh
+            future.set_result(items)
+        return future.result()
+
+    def fresh(self, keyword):
+        """이번 실행에서 처음 본 (URL/제목 중복 제외) 기사 리스트"""
+        self.search(keyword)
+        with self._lock:
+            return self._fresh.get(keyword, [])
+
+    def headline(self, keyword):
+        """최상단 기사 {"title", "link"} 또는 None"""
+        items = self.search(keyword)
+        if not items:
+            return None
+        return {"title": items[0]["title"], "link": items[0]["link"]}
+
+    def _fetch(self, keyword):
+        try:
+            res = transport.get(self.BASE_URL + keyword, headers=self.headers)
+            if res.status_code != 200:
+                return None
+            return self._parse(res.text)
+        except Exception:
+            return None
+
+    def _parse(self, html):
+        # [V16.29] div.news_area 아이템만 추출 (engines/parsing.py, 기본 lxml)
+        return [
+            {"title": item["title"], "link": item["link"], "time": parse_news_time(item["infos"])}
+            for item in parsing.extract("news_search", html)
+        ]
+
+
+_RELATIVE_UNITS = {"초": "seconds", "분": "minutes", "시간": "hours", "일": "days", "주": "weeks"}
+
+
+def parse_news_time(texts, now=None):
+    """
+    네이버 기사 시각 문구('3분 전', '1시간 전', '2024.01.05.')를 datetime으로 변환
+    - 해석 불가 시 None
+    """
+    now = now or datetime.now()
+    for text in texts:
+        m = re.match(r"(\d+)\s*(초|분|시간|일|주)\s*전", text)
+        if m:
+            return now - timedelta(**{_RELATIVE_UNITS[m.group(2)]: int(m.group(1))})
+        m = re.match(r"(\d{4})\.(\d{1,2})\.(\d{1,2})\.?", text)
+        if m:
+            return datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    return None
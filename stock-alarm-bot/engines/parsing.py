@@ -0,0 +1,166 @@
+import multiprocessing
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import config
+from engines.profiler import span
+
+try:
+    import lxml.html as lxml_html
+except ImportError: # lxml 미설치 시 BeautifulSoup 경로만 사용
+    lxml_html = None
+
+
+def _has_class(tag, cls):
+    return f"{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+
+
+def _text(node, strip=False):
+    """BeautifulSoup get_text() / get_text(strip=True)와 같은 결과"""
+    parts = node.itertext()
+    return "".join(p.strip() for p in parts) if strip else "".join(parts)
+
+
+def _class_pattern(cls):
+    # SoupStrainer용 (bs4 버전에 따라 다중 class 값을 통째로 또는 하나씩 비교하므로 정규식 사용)
+    return re.compile(rf"(^|\s){cls}(\s|$)")
+
+
+def _document(html):
+    if not html.strip():
+        return None
+    try:
+        return lxml_html.fromstring(html)
+    except ValueError: # 인코딩 선언이 있는 유니코드 문자열
+        return lxml_html.fromstring(html.encode("utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# 페이지별 추출기: 백엔드와 무관하게 같은 형태의 결과 반환
+# - news_search: [{"title", "link", "infos": [...]}, ...]
+# - sise_deposit: [[라벨, 값], ...] (div.box_type_m > table.type_2 의 행)
+# ---------------------------------------------------------------------------
+
+def _news_lxml(html):
+    doc = _document(html)
+    if doc is None:
+        return []
+    items = []
+    for area in doc.xpath("//" + _has_class("div", "news_area")):
+        titles = area.xpath(".//" + _has_class("a", "news_tit"))
+        title = titles[0] if titles else None
+        items.append({
+            "title": _text(title) if title is not None else "",
+            "link": title.get("href", "") if title is not None else "",
+            "infos": [_text(info, strip=True) for info in area.xpath(".//" + _has_class("span", "info"))],
+        })
+    return items
+
+
+def _news_bs4(html, parser):
+    from bs4 import BeautifulSoup, SoupStrainer
+    only = SoupStrainer("div", class_=_class_pattern("news_area")) if parser != "html.parser.full" else None
+    soup = BeautifulSoup(html, parser.replace(".full", ""), parse_only=only)
+    items = []
+    # 'news_area'는 각 뉴스 아이템의 클래스
+    for area in soup.select("div.news_area"):
+        title_tag = area.select_one("a.news_tit")
+        items.append({
+            "title": title_tag.get_text() if title_tag else "",
+            "link": title_tag['href'] if title_tag and title_tag.has_attr('href') else "",
+            "infos": [info.get_text(strip=True) for info in area.select("span.info")],
+        })
+    return items
+
+
+def _deposit_lxml(html):
+    doc = _document(html)
+    if doc is None:
+        return []
+    tables = doc.xpath("//" + _has_class("div", "box_type_m") + "/" + _has_class("table", "type_2"))
+    if not tables:
+        return []
+    rows = []
+    for row in tables[0].xpath(".//tr"):
+        cols = row.xpath(".//td")
+        if len(cols) >= 2:
+            rows.append([_text(cols[0], strip=True), _text(cols[1], strip=True)])
+    return rows
+
+
+def _deposit_bs4(html, parser):
+    from bs4 import BeautifulSoup, SoupStrainer
+    only = SoupStrainer("div", class_=_class_pattern("box_type_m")) if parser != "html.parser.full" else None
+    soup = BeautifulSoup(html, parser.replace(".full", ""), parse_only=only)
+    table = soup.select_one("div.box_type_m > table.type_2")
+    rows = []
+    if table:
+        for row in table.select("tr"):
+            cols = row.select("td")
+            if len(cols) >= 2:
+                rows.append([cols[0].get_text(strip=True), cols[1].get_text(strip=True)])
+    return rows
+
+
+# 백엔드
+# - lxml: lxml.html + XPath (C 파서, 필요한 노드만 조회)
+# - bs4-lxml / bs4: BeautifulSoup + SoupStrainer (대상 노드만 트리 생성)
+# - html.parser.full: 기존 방식 (html.parser로 전체 DOM 생성, 비교 기준)
+EXTRACTORS = {
+    "news_search": {
+        "lxml": _news_lxml,
+        "bs4-lxml": lambda html: _news_bs4(html, "lxml"),
+        "bs4": lambda html: _news_bs4(html, "html.parser"),
+        "html.parser.full": lambda html: _news_bs4(html, "html.parser.full"),
+    },
+    "sise_deposit": {
+        "lxml": _deposit_lxml,
+        "bs4-lxml": lambda html: _deposit_bs4(html, "lxml"),
+        "bs4": lambda html: _deposit_bs4(html, "html.parser"),
+        "html.parser.full": lambda html: _deposit_bs4(html, "html.parser.full"),
+    },
+}
+
+
+def available_backends():
+    backends = ["lxml", "bs4-lxml"] if lxml_html is not None else []
+    return backends + ["bs4", "html.parser.full"]
+
+
+def default_backend():
+    """HTML_PARSER 설정값 (auto: lxml 설치 시 lxml, 아니면 bs4)"""
+    backend = getattr(config, "HTML_PARSER", "auto")
+    if backend == "auto" or backend not in available_backends():
+        return available_backends()[0]
+    return backend
+
+
+def _extract(kind, backend, html):
+    return EXTRACTORS[kind][backend](html)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _process_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # 스레드가 많은 프로세스에서 fork는 위험하므로 spawn 사용
+            _pool = ProcessPoolExecutor(max_workers=config.HTML_PROCESS_WORKERS,
+                                        mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def extract(kind, html, backend=None):
+    """
+    [V16.29] 페이지 종류별 필요한 노드만 추출
+    - HTML_PROCESS_WORKERS > 0 이면 별도 프로세스에서 파싱 (동시에 많은 페이지를 처리할 때 GIL 회피)
+    """
+    backend = backend or default_backend()
+    with span("parse", f"naver:{kind}", bytes=len(html), backend=backend):
+        if getattr(config, "HTML_PROCESS_WORKERS", 0) > 0:
+            return _process_pool().submit(_extract, kind, backend, html).result()
+        return _extract(kind, backend, html)
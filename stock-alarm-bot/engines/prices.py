@@ -0,0 +1,106 @@
+import threading
+
+import pandas as pd
+
+from engines import health
+from engines.profiler import span
+
+
+def download_closes(symbols, period="5d", start=None):
+    """
+    여러 티커의 종가를 yfinance 단일 요청(yf.download)으로 수집
+    - start(YYYY-MM-DD)가 주어지면 period 대신 해당 날짜부터 조회 (증분 수집용)
+    - 반환: index=날짜, columns=티커 인 종가 DataFrame
+    """
+    symbols = list(dict.fromkeys(symbols))
+    if not symbols:
+        return pd.DataFrame()
+
+    with span("import", "yfinance"):
+        import yfinance as yf # 무거운 모듈이라 실제 다운로드 시점에 import
+
+    window = {"start": start} if start else {"period": period}
+    with health.guard("yfinance") as call, span("http", "yfinance:download", host="yfinance", symbols=len(symbols)):
+        raw = yf.download(symbols, group_by="column", auto_adjust=False,
+                          progress=False, threads=True, **window)
+        if raw is None or raw.empty:
+            call.fail("empty download") # yfinance는 차단/장애 시 예외 대신 빈 프레임을 반환
+    if raw is None or raw.empty:
+        return pd.DataFrame(columns=symbols)
+
+    closes = raw["Close"]
+    if isinstance(closes, pd.Series): # 단일 티커 + 단일 레벨 컬럼인 경우
+        closes = closes.to_frame(symbols[0])
+    return closes.reindex(columns=symbols)
+
+
+def quote_frame(closes):
+    """
+    종가 DataFrame -> 티커별 현재가/전일가/등락률 (열 단위 벡터 연산)
+    - 한국/미국 휴장일이 달라 생기는 NaN 행은 티커별 '마지막 유효 2개 값'으로 처리
+    - 반환: index=티커, columns=[price, prev, change]
+    """
+    if closes.empty:
+        return pd.DataFrame(columns=["price", "prev", "change"], dtype=float)
+
+    valid = closes.notna()
+    count = valid.cumsum() # 티커별 유효 데이터 누적 개수
+    last_n = count.iloc[-1]
+
+    price = closes.where(valid & (count == last_n)).max()
+    prev = closes.where(valid & (count == last_n - 1)).max()
+    change = (price - prev) / prev * 100
+
+    return pd.DataFrame({"price": price, "prev": prev, "change": change})
+
+
+class PriceBoard:
+    """
+    [V16.14] 배치 시세 엔진
+    - 실행마다 필요한 전 종목(매크로 + 섹터 + 안전자산)을 한 번의 요청으로 받아 공유
+    - 이미 받은 티커는 재요청하지 않고, 빠진 티커만 묶어서 추가 요청
+    - cache(TTLCache)가 주어지면 TTL 이내의 시세는 요청 없이 재사용
+    """
+    def __init__(self, period="5d", cache=None):
+        self.period = period
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._frame = quote_frame(pd.DataFrame())
+
+    def reset(self):
+        with self._lock:
+            self._frame = quote_frame(pd.DataFrame())
+
+    def load(self, symbols):
+        """누락된 티커만 배치 요청하여 보드에 적재"""
+        with self._lock:
+            missing = [s for s in dict.fromkeys(symbols) if s not in self._frame.index]
+            if not missing:
+                return
+
+            cached = {}
+            if self.cache is not None:
+                for symbol in missing:
+                    values = self.cache.get_many(symbol, ("price", "prev"))
+                    if values:
+                        cached[symbol] = values
+            to_fetch = [s for s in missing if s not in cached]
+
+            fetched = quote_frame(download_closes(to_fetch, self.period)) if to_fetch else quote_frame(pd.DataFrame())
+            if self.cache is not None:
+                for symbol, row in fetched.dropna(subset=["price", "prev"]).iterrows():
+                    self.cache.set_many(symbol, {"price": float(row["price"]), "prev": float(row["prev"])})
+            if cached:
+                restored = pd.DataFrame.from_dict(cached, orient="index")
+                restored["change"] = (restored["price"] - restored["prev"]) / restored["prev"] * 100
+                fetched = pd.concat([fetched, restored]) if not fetched.empty else restored
+            # 요청했으나 응답이 없는 티커도 NaN 행으로 기록 (재요청 방지)
+            fetched = fetched.reindex(missing)
+            self._frame = pd.concat([self._frame, fetched]) if not self._frame.empty else fetched
+
+    def quotes(self, symbols):
+        """티커 리스트의 시세 프레임 (index=티커, columns=[price, prev, change])"""
+        symbols = list(symbols)
+        self.load(symbols)
+        with self._lock:
+            return self._frame.reindex(symbols)
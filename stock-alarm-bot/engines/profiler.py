@@ -0,0 +1,109 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class Profiler:
+    """
+    [V16.21] 실행 프로파일 (span 기록)
+    - kind: mission(Scout 임무) / http / parse / llm / telegram / import
+    - span마다 소요 시간 + 부가 정보(bytes, status, retries 등) 기록
+    - 실행 종료 시 JSON(run_profile.json) 덤프 + 텔레그램용 한 줄 요약
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local() # 스레드별 기록 대상 (redirect)
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = datetime.now()
+            self._t0 = time.perf_counter()
+            self.spans = []
+
+    @contextmanager
+    def span(self, kind, name, **attrs):
+        """
+        with profiler.span("http", url) as rec:
+            rec["status"] = 200
+        - 예외 발생 시 rec["error"]에 기록 후 그대로 전파
+        - redirect() 중인 스레드의 span은 지정한 프로파일러에 기록
+        """
+        target = getattr(self._local, "target", None) or self
+        record = {"kind": kind, "name": name, **attrs}
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record["start"] = round(start - target._t0, 4)
+            record["duration"] = round(time.perf_counter() - start, 4)
+            record["thread"] = threading.current_thread().name
+            with target._lock:
+                target.spans.append(record)
+
+    @contextmanager
+    def redirect(self, target):
+        """현재 스레드의 span을 target 프로파일러에 기록 (상주 감시 스레드가 리포트 요약을 오염시키지 않도록)"""
+        previous = getattr(self._local, "target", None)
+        self._local.target = target
+        try:
+            yield target
+        finally:
+            self._local.target = previous
+
+    def totals(self, kind):
+        """kind별 {name: 누적 소요 시간}"""
+        result = defaultdict(float)
+        with self._lock:
+            for record in self.spans:
+                if record["kind"] == kind:
+                    result[record["name"]] += record["duration"]
+        return dict(result)
+
+    def summary_line(self):
+        """텔레그램 리포트 하단에 붙는 한 줄 요약"""
+        with self._lock:
+            spans = list(self.spans)
+        elapsed = time.perf_counter() - self._t0
+
+        http = [s for s in spans if s["kind"] == "http"]
+        http_bytes = sum(s.get("bytes", 0) for s in http)
+        retries = sum(s.get("retries", 0) for s in http)
+        errors = sum(1 for s in http if "error" in s or s.get("status", 200) >= 400)
+
+        missions = sorted(self.totals("mission").items(), key=lambda kv: kv[1], reverse=True)[:3]
+        parts = [f"⏱️ Run {elapsed:.1f}s"]
+        if missions:
+            parts.append("slow: " + ", ".join(f"{name} {sec:.1f}s" for name, sec in missions))
+        llm = sum(self.totals("llm").values())
+        if llm:
+            parts.append(f"Brain {llm:.1f}s")
+        parts.append(f"HTTP {len(http)}req/{http_bytes / 1024:.0f}KB/{retries}retry/{errors}err")
+        parse = sum(self.totals("parse").values())
+        if parse:
+            parts.append(f"parse {parse:.2f}s")
+        imports = sum(self.totals("import").values())
+        if imports:
+            parts.append(f"import {imports:.1f}s")
+        return " | ".join(parts)
+
+    def dump(self, path):
+        with self._lock:
+            payload = {
+                "started_at": self.started_at.strftime("%Y-%m-%d %H:%M:%S"),
+                "elapsed": round(time.perf_counter() - self._t0, 4),
+                "spans": sorted(self.spans, key=lambda s: s["start"]),
+            }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+
+
+# 프로세스 공용 프로파일러
+profiler = Profiler()
+span = profiler.span
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import re
+
+import config
+from data import snapshot
+
+# 프롬프트에 보낼 필요 없는 필드 (토큰만 차지)
+DROP_KEYS = {"link", "stale"}
+# 응답 캐시 키에서 제외하는 필드 (매 실행마다 바뀜)
+VOLATILE_KEYS = {"timestamp"}
+MISSING = {"", "N/A", "Error", "Data Unavailable"}
+
+_NUMBER = re.compile(r"^\$?([+-]?[\d,]*\.?\d+)%?$")
+_THOUSANDS = re.compile(r"^[+-]?\d{1,3}(,\d{3})+(\.\d+)?$") # 1,421 / 1,421.00
+_QUOTE = re.compile(r"^(\S+) \(([^)]+)\)$") # "1,421.00 (+0.30%)"
+
+
+def _number(text, strict=True):
+    """
+    서식 숫자 문자열 -> 숫자 (strict: %, $, 천 단위 구분 중 하나가 있어야 변환)
+    - 종목코드 "005930", 제목 "2024" 같은 숫자만 있는 문자열은 그대로 둠
+    """
+    text = text.strip()
+    match = _NUMBER.match(text)
+    if not match:
+        return None
+    if strict and not (text.startswith("$") or text.endswith("%") or _THOUSANDS.match(match.group(1))):
+        return None
+    value = float(match.group(1).replace(",", ""))
+    return int(value) if value.is_integer() and "." not in match.group(1) else value
+
+
+def _round(value):
+    if isinstance(value, float):
+        return round(value, 2) if abs(value) >= 1 else round(value, 4)
+    return value
+
+
+def compact(value):
+    """
+    [V16.26] 프롬프트용 최소 표현
+    - 서식 문자열("1,421.00 (+0.30%)", "12.3%", "$123.45")은 숫자로 ([가격, 등락률] / 값)
+    - [V16.30] 스냅샷 레코드는 숫자 필드 그대로 (시세는 [가격, 등락률])
+    - N/A, 에러, 빈 값, 링크 등은 제거
+    """
+    if isinstance(value, snapshot.Quote):
+        return None if value.price is None else [_round(value.price), _round(value.change)]
+    if snapshot.is_record(value):
+        # 레코드의 문자열 필드(종목코드/이름/접수일)는 이미 타입이 정해진 값이라 숫자로 바꾸지 않음
+        result = {}
+        for key, item in value.as_dict().items():
+            item = item if isinstance(item, str) else compact(item)
+            if item is not None and item != {} and item != []:
+                result[key] = item
+        return result
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            if key in DROP_KEYS:
+                continue
+            item = compact(item)
+            if item is not None and item != {} and item != []:
+                result[key] = item
+        return result
+    if isinstance(value, (list, tuple)):
+        return [compact(item) for item in value]
+    if isinstance(value, str):
+        text = value.strip()
+        if text in MISSING:
+            return None
+        number = _number(text)
+        if number is not None:
+            return _round(number)
+        quote = _QUOTE.match(text)
+        if quote:
+            price, change = _number(quote.group(1), strict=False), _number(quote.group(2))
+            if price is not None and change is not None:
+                return [_round(price), _round(change)]
+        return text
+    if isinstance(value, float):
+        return None if value != value else _round(value) # NaN 제거
+    return value
+
+
+def dumps(value):
+    """공백 없는 JSON"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+def digest(snapshot):
+    """응답 캐시 키 (휘발성 필드 제외한 내용 해시)"""
+    stable = {k: v for k, v in snapshot.items() if k not in VOLATILE_KEYS}
+    return hashlib.sha256(dumps(stable).encode("utf-8")).hexdigest()
+
+
+def _changed(current, previous, pct, floor):
+    if isinstance(current, bool) or isinstance(previous, bool):
+        return current != previous
+    if isinstance(current, (int, float)) and isinstance(previous, (int, float)):
+        return abs(current - previous) > max(floor, abs(previous) * pct / 100)
+    if isinstance(current, list) and isinstance(previous, list) and len(current) == len(previous):
+        return any(_changed(c, p, pct, floor) for c, p in zip(current, previous))
+    return current != previous
+
+
+def changes(current, previous, pct=None, floor=None):
+    """
+    previous 대비 임계값 이상 바뀐 필드만 남긴 dict (새로 생긴 필드 포함)
+    - 숫자: |변화| > max(floor, |이전값| x pct%)
+    - 그 외: 값이 다르면 변화
+    - 사라진 필드(수집 실패 등)는 None으로 표기 -> 변화로 취급 (캐시 재사용 방지)
+    """
+    pct = config.PROMPT_CHANGE_PCT if pct is None else pct
+    floor = config.PROMPT_CHANGE_ABS if floor is None else floor
+    result = {}
+    for key, value in current.items():
+        if key in VOLATILE_KEYS:
+            continue
+        old = previous.get(key) if isinstance(previous, dict) else None
+        if isinstance(value, dict) and isinstance(old, dict):
+            nested = changes(value, old, pct, floor)
+            if nested:
+                result[key] = nested
+        elif old is None or _changed(value, old, pct, floor):
+            result[key] = value
+    if isinstance(previous, dict):
+        for key in previous:
+            if key not in current and key not in VOLATILE_KEYS:
+                result[key] = None
+    return result
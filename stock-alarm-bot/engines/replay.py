@@ -0,0 +1,172 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# 날짜/세션에 따라 매번 바뀌는 파라미터 (매칭 키에서 제외)
+VOLATILE_PARAMS = {
+    "period1", "period2", "crumb", "_", "basDt", "start", "end",
+    "strtDd", "endDd", "trdDd", "fromdate", "todate", "cosd", "coed",
+    "bgn_de", "end_de", "crtfc_key", "serviceKey",
+}
+
+
+def _normalize(pairs):
+    return urlencode(sorted((k, v) for k, v in pairs if k not in VOLATILE_PARAMS))
+
+
+def request_key(method, url, body=None):
+    """녹화/재생 매칭 키: 메소드 + 호스트/경로 + (휘발성 파라미터 제외) 쿼리/폼 본문"""
+    parts = urlsplit(url)
+    key = f"{method} {parts.netloc}{parts.path}?{_normalize(parse_qsl(parts.query))}"
+    if body:
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        try:
+            form = _normalize(parse_qsl(body.decode("utf-8"), strict_parsing=True))
+        except (UnicodeDecodeError, ValueError):
+            form = hashlib.sha1(body).hexdigest()
+        key += f" body={form}"
+    return key
+
+
+class _Recording:
+    """requests 전송 계층(HTTPAdapter.send) 패치 공통부 + 호스트별 통계"""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._original = None
+        self.stats = defaultdict(lambda: {"requests": 0, "bytes": 0, "misses": 0})
+
+    def _count(self, host, nbytes, miss=False):
+        with self._lock:
+            entry = self.stats[host]
+            entry["requests"] += 1
+            entry["bytes"] += nbytes
+            entry["misses"] += int(miss)
+
+    def reset_stats(self):
+        with self._lock:
+            self.stats.clear()
+
+    def totals(self):
+        with self._lock:
+            return {
+                "requests": sum(s["requests"] for s in self.stats.values()),
+                "bytes": sum(s["bytes"] for s in self.stats.values()),
+                "misses": sum(s["misses"] for s in self.stats.values()),
+            }
+
+    def __enter__(self):
+        self._original = HTTPAdapter.send
+        recording = self
+
+        def send(adapter, request, **kwargs):
+            return recording._send(adapter, request, **kwargs)
+
+        HTTPAdapter.send = send
+        return self
+
+    def __exit__(self, *exc):
+        HTTPAdapter.send = self._original
+        self._original = None
+        return False
+
+
+class Recorder(_Recording):
+    """
+    [V16.20] 실제 응답을 로컬 fixture(JSON Lines)로 녹화
+    - requests 기반 호출(transport, yfinance, pykrx, pandas_datareader) 전체 대상
+    """
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self._records = []
+
+    def _send(self, adapter, request, **kwargs):
+        response = self._original(adapter, request, **kwargs)
+        content = response.content # 본문을 읽어 두어야 녹화/재사용 가능
+        with self._lock:
+            self._records.append({
+                # 원본 URL은 API 키를 포함할 수 있어 저장하지 않음 (키는 휘발성 파라미터 제외)
+                "key": request_key(request.method, request.url, request.body),
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": dict(response.headers),
+                "body": base64.b64encode(content).decode("ascii"),
+                "elapsed": response.elapsed.total_seconds(),
+            })
+        self._count(urlsplit(request.url).netloc, len(content))
+        return response
+
+    def __exit__(self, *exc):
+        super().__exit__(*exc)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            for record in self._records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return False
+
+
+class Replayer(_Recording):
+    """
+    [V16.20] 녹화된 fixture로 응답 재생 (네트워크 미사용)
+    - latency: {호스트: 초} 호스트별 지연 시뮬레이션 (기본값 default_latency)
+    - 같은 키가 여러 번 녹화되었으면 순서대로 돌려가며 재생
+    - 녹화에 없는 요청은 ConnectionError (실제 장애와 같은 경로로 처리되도록)
+    """
+    def __init__(self, path, latency=None, default_latency=0.0):
+        super().__init__()
+        self.latency = latency or {}
+        self.default_latency = default_latency
+        self._fixtures = defaultdict(list)
+        self._cursor = defaultdict(int)
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self._fixtures[record["key"]].append(record)
+
+    def _send(self, adapter, request, **kwargs):
+        host = urlsplit(request.url).netloc
+        key = request_key(request.method, request.url, request.body)
+        with self._lock:
+            records = self._fixtures.get(key)
+            record = None
+            if records:
+                record = records[self._cursor[key] % len(records)]
+                self._cursor[key] += 1
+
+        delay = self.latency.get(host, self.default_latency)
+        if delay:
+            time.sleep(delay)
+
+        if record is None:
+            self._count(host, 0, miss=True)
+            raise requests.ConnectionError(f"[replay] fixture 없음: {key}", request=request)
+
+        content = base64.b64decode(record["body"])
+        self._count(host, len(content))
+
+        response = requests.Response()
+        response.status_code = record["status"]
+        response.reason = record.get("reason")
+        response.headers = CaseInsensitiveDict(record["headers"])
+        # 녹화 시 이미 해제된 본문이므로 압축 관련 헤더 제거
+        response.headers.pop("Content-Encoding", None)
+        response._content = content
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.elapsed = timedelta(seconds=delay)
+        response.connection = adapter
+        return response
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+
+import config
+
+
+def rolling_metrics(series, window=None):
+    """
+    [V16.18] 롤링 윈도우 리스크 지표 (벡터 연산)
+    - Z: (값 - 롤링 평균) / 롤링 표준편차
+    - Slope ($V_p$): Z의 1차 차분 (공포의 속도)
+    - Accel ($A_p$): Z의 2차 차분 (속도의 변화)
+    - VIX 외에 USD/KRW, TNX 등 임의의 종가 Series에 적용 가능
+    - 반환: index=날짜, columns=[value, mean, std, Z, Slope, Accel]
+    """
+    window = window or config.RISK_WINDOW
+    values = series.astype(float)
+    mean = values.rolling(window, min_periods=window).mean()
+    std = values.rolling(window, min_periods=window).std()
+
+    z = (values - mean) / std.replace(0, np.nan)
+    slope = z.diff()
+    accel = slope.diff()
+
+    return pd.DataFrame({
+        "value": values, "mean": mean, "std": std,
+        "Z": z, "Slope": slope, "Accel": accel,
+    })
+
+
+def snr(pulse, slope, noise_sigma=None, pulse_floor=0.5):
+    """
+    [Math Formula V16.10] SNR = (Pulse * dZ/dt) / sigma_noise
+    - Pulse가 0일 경우를 대비해 최소 pulse_floor 보정 (Silent Crisis 방지)
+    - 방향성: Slope가 음수면 SNR도 음수 (Crisis Fading)
+    - 스칼라/배열/Series 모두 지원 (백테스트 파라미터 스윕용)
+    """
+    noise_sigma = noise_sigma if noise_sigma is not None else config.SNR_NOISE_SIGMA
+    return np.maximum(pulse, pulse_floor) * slope / noise_sigma
+
+
+def latest(metrics):
+    """지표 프레임의 마지막 유효 행 (collect_data가 기대하는 현재값)"""
+    valid = metrics.dropna(subset=["Z", "Slope", "Accel"])
+    if valid.empty:
+        return None
+    return valid.iloc[-1]
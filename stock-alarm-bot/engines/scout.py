@@ -1,69 +1,227 @@
-import requests
-from bs4 import BeautifulSoup
-from pykrx import stock
 import time
-import yfinance as yf
 import pandas as pd
 import config
+from engines import parsing, transport
+from engines.news import NewsSearch
+from engines.prices import PriceBoard, quote_frame
+from engines import risk as risk_metrics
+from engines.profiler import span
+from engines import health
+from engines.deadline import Deadline, spawn
+from data.cache import TTLCache, open_ticker_cache
+from data.timeseries import open_timeseries_store
+from data.flows import open_flow_store
+from data.articles import open_article_index
+from data.disclosures import open_disclosure_store
+from data.sessions import get_calendar
+from data.snapshot import Quote, RiskSnapshot, StockSnapshot, from_plain, now_stamp, parse_number, to_plain
 from datetime import datetime, timedelta
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
 
-import pandas_datareader.data as pdr
+# [V16.24] yfinance / pykrx / pandas_datareader는 무거우므로 실제 사용하는 임무 안에서 import
 
 class Scout:
     """
     [Scout V16.0]
     웹 크롤링(BeautifulSoup)과 yfinance를 사용하여 원천 데이터를 수집하는 정찰병.
     """
-    def __init__(self):
+    def __init__(self, max_workers=None):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
+        # [V16.12] 병렬 수집 설정 (1이면 기존 순차 모드)
+        self.max_workers = max_workers or getattr(config, 'SCOUT_MAX_WORKERS', 1)
+        self._pool = None # collect_data 실행 중에만 존재하는 종목/키워드 단위 fetch 풀
+        # [V16.13] 네이버 뉴스 검색 공용 계층 (키워드당 실행 1회 요청)
+        # [V16.34] 기사 색인 (이미 본 기사 제외, 키워드별 감쇠 Pulse 상태)
+        self.articles = open_article_index()
+        self.news = NewsSearch(self.headers, index=self.articles)
+        self._pulse_pending = None # (새 기사, 감쇠 상태, 시각): Pulse 임무가 제시간에 끝났을 때만 색인에 반영
+        # [V16.16] 실행 간 유지되는 티커 캐시 (재무 지표는 일 단위, 시세는 분 단위 TTL)
+        self.cache = open_ticker_cache()
+        # [V16.14] 배치 시세 엔진 (전 종목 1회 요청)
+        self.prices = PriceBoard(cache=self.cache)
+        # [V16.17] 로컬 일봉 저장소 (VIX/매크로: 새 봉만 증분 수집)
+        self.series = open_timeseries_store()
+        self.flows = open_flow_store() # [V16.32] KRX 투자자별 일별 순매수
+        self.disclosures = open_disclosure_store() if config.OPENDART_API_KEY else None # [V16.35] DART 공시
+        # [V16.22] 임무별 마지막 성공 값 (마감 초과 시 stale 대체용)
+        self.last_good = TTLCache(os.path.join(config.CACHE_DIR, "missions.json"),
+                                  default_ttl=getattr(config, 'STALE_MAX_AGE', 7 * 24 * 3600))
 
-    def collect_data(self, sectors, macros):
+    def _map(self, func, items):
+        """
+        종목/키워드 단위 fetch를 fetch 풀에서 병렬 실행 (순서 보존)
+        - 풀이 없으면(단독 호출 또는 순차 모드) 그대로 순차 실행
+        """
+        items = list(items)
+        if self._pool is None or len(items) <= 1:
+            return [func(item) for item in items]
+        return list(self._pool.map(func, items))
+
+    def _refresh_series(self, symbols):
+        """로컬 일봉 증분 갱신 (실패해도 저장된 데이터로 계속 진행)"""
+        try:
+            self.series.refresh(symbols)
+        except Exception as e:
+            print(f"    ⚠️ 시계열 갱신 실패 (로컬 데이터 사용): {e}")
+
+    @staticmethod
+    def _timed(name, func):
+        """임무 실행 시간을 프로파일러에 기록"""
+        def run():
+            with span("mission", name):
+                return func()
+        return run
+
+    def _run_missions(self, missions, deadline):
+        """
+        독립 임무들을 실행하여 ({임무명: 결과}, {임무명: 마지막 성공 시각}) 반환
+        - 임무 풀과 fetch 풀을 분리: 임무 안에서 다시 fetch를 제출해도 교착되지 않음
+        - [V16.22] 임무별 예산(MISSION_BUDGETS)과 전체 마감 중 먼저 오는 시점까지만 대기
+          넘긴 임무는 버리고 마지막 성공 값(stale)으로 대체
+        """
+        missions = {name: self._timed(name, func) for name, func in missions.items()}
+        budgets = getattr(config, 'MISSION_BUDGETS', {})
+        results, stale = {}, {}
+
+        def settle(name, future):
+            try:
+                results[name] = future.result(timeout=deadline.remaining(budgets.get(name)))
+                self.last_good.set("mission", name, {
+                    "value": to_plain(results[name]), "at": now_stamp()
+                })
+            except Exception as e:
+                reason = "예산 초과" if isinstance(e, TimeoutError) else f"실패: {e}"
+                print(f"    ⏰ [{name}] {reason} -> 마지막 수집 값 사용")
+                cached = self.last_good.get("mission", name) or {}
+                results[name] = from_plain(cached.get("value", {}))
+                stale[name] = cached.get("at", "N/A")
+
+        if self.max_workers <= 1:
+            for name, func in missions.items():
+                settle(name, spawn(func, name=f"scout-{name}"))
+            return results, stale
+
+        fetch_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="scout-fetch")
+        self._pool = fetch_pool
+        try:
+            futures = {name: spawn(func, name=f"scout-{name}") for name, func in missions.items()}
+            for name, future in futures.items():
+                settle(name, future)
+            return results, stale
+        finally:
+            self._pool = None
+            # 마감 후 남은 fetch는 취소 (진행 중인 요청은 transport timeout으로 종료)
+            fetch_pool.shutdown(wait=False, cancel_futures=True)
+
+    def collect_data(self, sectors, macros, deadline=None):
         """
         통합 데이터 수집 (4대 임무 수행)
+        - [V16.12] SCOUT_MAX_WORKERS > 1 이면 임무 및 종목/키워드 fetch를 병렬 수행
+        - [V16.22] deadline(engines.deadline.Deadline)까지 못 끝낸 임무는 마지막 값으로 대체,
+          data["stale"]에 {임무명: 해당 값의 수집 시각} 표기
         """
-        print(f"🕵️ Scout: 정찰 임무 시작... (Time: {datetime.now().strftime('%H:%M:%S')})")
-        
+        print(f"🕵️ Scout: 정찰 임무 시작... (Time: {datetime.now().strftime('%H:%M:%S')}, Workers: {self.max_workers})")
+        deadline = deadline or Deadline(getattr(config, 'COLLECT_DEADLINE_SEC', 120))
+        self.news.reset()
+        self.prices.reset()
+        self.series.reset()
+        self.flows.reset()
+        self._pulse_pending = None
+
+        def prefetch():
+            # 섹터 + 안전자산 시세를 한 번의 요청으로 선적재
+            try:
+                symbols = list(config.SAFE_HAVEN_TICKERS.values())
+                symbols += [code for tickers in sectors.values() for code in tickers]
+                self.prices.load(symbols)
+            except Exception as e:
+                print(f"    ⚠️ 배치 시세 수집 실패: {e}")
+
+            # VIX + 매크로 일봉은 로컬 저장소에 새 봉만 증분 적재 (한 번의 요청)
+            self._refresh_series(["^VIX"] + list(macros.values()))
+
+        try:
+            spawn(prefetch, name="scout-prefetch").result(
+                timeout=deadline.remaining(getattr(config, 'MISSION_BUDGETS', {}).get("prefetch")))
+        except TimeoutError:
+            print("    ⏰ [prefetch] 예산 초과 -> 임무별 개별 수집으로 진행")
+
+        missions = {
+            "risk_indices": self.get_risk_indices,
+            "pulse_score": self.calculate_pulse_score,
+            "market_index": self.get_korea_market_index,
+            "macro": lambda: self.get_macro_data(macros),
+            "players": self.get_players_data,
+            "policy_news": self.get_policy_news,
+            "micro": lambda: self.get_micro_data(sectors),
+            "safe_haven_data": lambda: self.get_micro_data({"Defensive Assets": config.SAFE_HAVEN_TICKERS}),
+        }
+        if getattr(config, 'UNIVERSE_SCAN', False):
+            missions["universe"] = self.get_universe_picks
+        if self.disclosures is not None:
+            missions["disclosures"] = self.get_disclosures
+        results, stale = self._run_missions(missions, deadline)
+
+        # [V16.34] Pulse 값이 채택된 경우에만 새 기사/감쇠 상태 저장 (stale이면 다음 실행에 다시 반영)
+        pending = self._pulse_pending
+        if pending is not None and "pulse_score" not in stale:
+            try:
+                self.articles.commit(*pending)
+            except Exception as e:
+                print(f"    ⚠️ 기사 색인 저장 실패: {e}")
+
         # [V16.8] SNR Calculation
-        risk = self.get_risk_indices()
-        pulse = self.calculate_pulse_score()
+        risk = results["risk_indices"]
+        if not isinstance(risk, RiskSnapshot): # 이전 값도 없거나 예전 형식이면 빈 스냅샷
+            risk = RiskSnapshot()
+        pulse = results["pulse_score"]
         
         try:
-            vix_slope = float(risk.get("VIX_Slope", 0)) # dZ/dt (Acceleration of Impact)
+            vix_slope = risk.vix_slope or 0.0 # dZ/dt (Acceleration of Impact)
             pulse_score = float(pulse.get("score", 0))
             
-            # [Math Formula V16.10]
-            # SNR = (Pulse * dZ/dt) / sigma_noise
-            AVG_NOISE_INTENSITY = 1.0 # sigma_noise (Historical Average)
-            
-            # Pulse가 0일 경우를 대비해 최소 0.5 보정 (Silent Crisis 방지)
-            adjusted_pulse = max(pulse_score, 0.5)
-            
-            # Calculate SNR
-            snr = (adjusted_pulse * abs(vix_slope)) / AVG_NOISE_INTENSITY
-            
-            # 방향성 보정: Slope가 음수면 SNR도 음수로 표기 (Crisis Fading)
-            if vix_slope < 0:
-                snr = -snr
-        except:
+            # [Math Formula V16.10] SNR = (Pulse * dZ/dt) / sigma_noise (engines/risk.py)
+            snr = float(risk_metrics.snr(pulse_score, vix_slope))
+        except Exception:
             snr = 0.0
 
+        # [V16.30] 값은 숫자/레코드(data/snapshot.py) 그대로, 표시 문자열은 리포트 출력 시에만 생성
         data = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": now_stamp(),
             "risk_indices": risk,
             "pulse_score": pulse,
-            "snr": f"{snr:.2f}", # [V16.8] 신호 대 소음비
-            "market_index": self.get_korea_market_index(),
-            "macro": self.get_macro_data(macros),
-            "players": self.get_players_data(),
-            "policy_news": self.get_policy_news(),
-            "micro": self.get_micro_data(sectors),
-            "safe_haven_data": self.get_micro_data({"Defensive Assets": config.SAFE_HAVEN_TICKERS})
+            "snr": round(snr, 4), # [V16.8] 신호 대 소음비
+            "market_index": results["market_index"],
+            "macro": results["macro"],
+            "players": results["players"],
+            "policy_news": results["policy_news"],
+            "micro": results["micro"],
+            "safe_haven_data": results["safe_haven_data"],
+            "universe": results.get("universe", []), # [V16.31] 전 종목 스캔 상위 (BUY_THRESHOLD 이상)
+            "disclosures": results.get("disclosures", []), # [V16.35] 감시 종목 최근 주요 공시
+            "stale": stale # [V16.22] 마감 초과로 이전 값을 쓴 임무 {임무명: 수집 시각}
         }
         
-        print(f"  - [SNR Analysis] Score: {snr:.2f} (Pulse: {pulse.get('score')}, Slope: {risk.get('VIX_Slope')})")
+        # 백테스트용 일별 Pulse Score 기록 (같은 날 재실행 시 덮어씀, stale 값은 기록하지 않음)
+        try:
+            if "pulse_score" not in stale:
+                self.series.append(config.PULSE_SERIES, pd.Series([float(pulse.get("score", 0))], index=[pd.Timestamp(datetime.now().date())]))
+        except Exception as e:
+            print(f"    ⚠️ Pulse 기록 실패: {e}")
+
+        try:
+            self.cache.save()
+            self.last_good.save()
+            health.get_registry().save()
+            self.articles.prune()
+        except Exception as e:
+            print(f"    ⚠️ 캐시 저장 실패: {e}")
+
+        print(f"  - [SNR Analysis] Score: {snr:.2f} (Pulse: {pulse.get('score')}, Slope: {risk.vix_slope})")
         print("✅ Scout: 정찰 임무 완료.")
         return data
 
@@ -73,60 +231,42 @@ class Scout:
         """
         print("  - [1/4] 거시경제 지표 수집 중...")
         result = {}
+        at = now_stamp()
 
-        # 1-1. 글로벌 지표 (yfinance)
-        for key, ticker_symbol in macro_tickers.items():
-            try:
-                ticker = yf.Ticker(ticker_symbol)
-                hist = ticker.history(period="5d")
-                if not hist.empty:
-                    current = hist['Close'].iloc[-1]
-                    prev = hist['Close'].iloc[-2]
-                    change = ((current - prev) / prev) * 100
-                    result[key] = f"{current:,.2f} ({change:+.2f}%)"
+        # 1-1. 글로벌 지표 (로컬 일봉 저장소, 새 봉만 증분 수집)
+        try:
+            self._refresh_series(macro_tickers.values())
+            symbols = list(macro_tickers.values())
+            quotes = quote_frame(self.series.frame(symbols, days=config.MACRO_LOOKBACK_DAYS)).reindex(symbols)
+            for key, ticker_symbol in macro_tickers.items():
+                row = quotes.loc[ticker_symbol]
+                if pd.notna(row["price"]) and pd.notna(row["change"]):
+                    result[key] = Quote(float(row["price"]), float(row["change"]), at)
                 else:
-                    result[key] = "N/A"
-            except Exception:
-                result[key] = "Error"
+                    result[key] = Quote(at=at)
+        except Exception:
+            for key in macro_tickers:
+                result[key] = Quote(at=at)
 
         # 1-2. 한국 국고채 금리 (네이버 금융 크롤링) - yfinance 데이터 부족 보완
-        try:
-            url = "https://finance.naver.com/marketindex/"
-            res = requests.get(url, headers=self.headers)
-            soup = BeautifulSoup(res.text, "html.parser")
-            
-            # (CSS 선택자는 네이버 금융 구조에 맞춰 조정 필요, 여기서는 예시 로직)
-            # 시장지표 리스트 순회 로직이 복잡하므로 간단히 환율 체크만 예시로 구현하거나
-            # 정확한 파싱 로직이 필요. 여기서는 '머니무브'에 집중하기로 함.
-            pass 
-        except Exception as e:
-            print(f"    ⚠️ 국고채 수집 실패: {e}")
+        # (https://finance.naver.com/marketindex/ 파싱 로직 미구현: 결과를 쓰지 않는 요청/파싱은 생략,
+        #  여기서는 '머니무브'에 집중하기로 함)
 
         # 1-3. 머니무브 (유동성) - 예탁금, 신용융자 등
         try:
             url = config.URLS["DEPOSIT"]
-            res = requests.get(url, headers=self.headers)
-            soup = BeautifulSoup(res.text, "html.parser")
+            res = transport.get(url, headers=self.headers)
             
-            # 예탁금 테이블 파싱 (가정: class='type_2')
+            # 예탁금 테이블 파싱 (가정: div.box_type_m > table.type_2 의 [라벨, 값] 행)
             # 실제 네이버 증시자금동향 페이지 구조 기반
-            table = soup.select_one("div.box_type_m > table.type_2")
-            if table:
-                rows = table.select("tr")
-                # 일반적으로 상단 행들에 데이터 위치
-                # 예: 고객예탁금(3번째 rows), 신용융자(...), CMA(...)
-                # 정확한 행 인덱스는 페이지 변경에 취약하므로 텍스트 검색 권장
-                
-                labels = ["고객예탁금", "신용융자", "CMA", "MMF"]
-                for row in rows:
-                    cols = row.select("td")
-                    if len(cols) >= 2:
-                        label = cols[0].get_text(strip=True)
-                        value = cols[1].get_text(strip=True)
-                        
-                        for target in labels:
-                            if target in label:
-                                result[target] = value # 콤마 포함 문자열 그대로
+            # 일반적으로 상단 행들에 데이터 위치
+            # 예: 고객예탁금(3번째 rows), 신용융자(...), CMA(...)
+            # 정확한 행 인덱스는 페이지 변경에 취약하므로 텍스트 검색 권장
+            labels = ["고객예탁금", "신용융자", "CMA", "MMF"]
+            for label, value in parsing.extract("sise_deposit", res.text):
+                for target in labels:
+                    if target in label:
+                        result[target] = parse_number(value) # 억원
         except Exception as e:
              print(f"    ⚠️ 머니무브 수집 실패: {e}")
              
@@ -138,84 +278,64 @@ class Scout:
         [V16.5] Global Risk Indices (EPU, VIX Z-Score, GPR Proxy)
         """
         print("  - [Plus] 글로벌 리스크 지표(EPU, VIX, GPR) 정밀 분석 중...")
-        result = {"EPU": "N/A", "VIX": "N/A", "VIX_Z": "0.0", "GPR": "N/A"}
+        result = RiskSnapshot(at=now_stamp())
         
         # 1. US Economic Policy Uncertainty Index (FRED)
         try:
             start = datetime.now() - timedelta(days=60)
             end = datetime.now()
-            epu_data = pdr.DataReader('USEPUINDXD', 'fred', start, end)
+            with span("import", "pandas_datareader"):
+                import pandas_datareader.data as pdr
+            with health.guard("fred"), span("http", "fred:USEPUINDXD", host="fred"):
+                epu_data = pdr.DataReader('USEPUINDXD', 'fred', start, end)
             if not epu_data.empty:
-                result["EPU"] = f"{epu_data.iloc[-1].item():.2f}"
+                result.epu = float(epu_data.iloc[-1].item())
         except Exception as e:
             print(f"    ⚠️ EPU 수집 실패: {e}")
 
-        # 2. VIX Z-Score (yfinance)
+        # 2. VIX Z-Score (로컬 일봉 저장소)
         try:
-            vix = yf.Ticker("^VIX")
-            # 30일 데이터 확보 (Z-Score 계산용)
-            hist = vix.history(period="3mo") # 넉넉히 3개월
-            if len(hist) >= 30:
-                 # Rolling Window로 구현하면 좋으나, 단순화를 위해 전체기간 Mean/Std 사용하되
-                 # 최근 데이터 변화를 반영
-                recent = hist['Close']
-                
-                # Z-Score Calculation
-                mean_vix = recent.mean()
-                std_vix = recent.std()
-                
-                current_vix = recent.iloc[-1]
-                prev_vix = recent.iloc[-2]
-                prev2_vix = recent.iloc[-3]
-                
-                z_current = (current_vix - mean_vix) / std_vix if std_vix != 0 else 0
-                z_prev = (prev_vix - mean_vix) / std_vix if std_vix != 0 else 0
-                z_prev2 = (prev2_vix - mean_vix) / std_vix if std_vix != 0 else 0
-                
-                # Vp (Velocity)
-                velocity_current = z_current - z_prev
-                velocity_prev = z_prev - z_prev2
-                
-                # Ap (Acceleration)
-                acceleration = velocity_current - velocity_prev
-                
-                result["VIX"] = f"{current_vix:.2f}"
-                result["VIX_Z"] = f"{z_current:.2f}"
-                result["VIX_Slope"] = f"{velocity_current:.2f}" # Vp
-                result["VIX_Accel"] = f"{acceleration:.2f}" # Ap
+            # [V16.18] 롤링 윈도우 Z-Score / Vp / Ap (engines/risk.py)
+            current = risk_metrics.latest(self.get_risk_history("^VIX"))
+            if current is not None:
+                result.vix = float(current["value"])
+                result.vix_z = float(current["Z"])
+                result.vix_slope = float(current["Slope"]) # Vp
+                result.vix_accel = float(current["Accel"]) # Ap
         except Exception as e:
             print(f"    ⚠️ VIX 수집 실패: {e}")
 
         # 3. GPR Proxy (News Keyword Velocity)
-        result["GPR_Proxy"] = self.get_gpr_proxy()
+        result.gpr = self.get_gpr_proxy()
             
         return result
 
+    def get_risk_history(self, symbol, window=None):
+        """
+        [V16.18] 심볼(VIX, KRW=X, ^TNX 등)의 전체 롤링 리스크 지표 이력
+        - 로컬 일봉 저장소 기준, 알림/백테스트용
+        """
+        self._refresh_series([symbol])
+        return risk_metrics.rolling_metrics(self.series.window(symbol, days=config.RISK_LOOKBACK_DAYS), window)
+
     def get_gpr_proxy(self):
         """
         [V16.5] 정치 리스크 프록시 (Risk Velocity)
         - 특정 키워드(계엄, 탄핵 등)의 뉴스 출현 빈도 체크
+        - [V16.34] 검색 결과 노출 여부가 아니라 최근 GPR_RECENT_HOURS 안에 나온 기사가 있는지로 판단
+          (검색 실패 시 색인에 저장된 기사로 판단)
         """
         keywords = ['계엄', '내란', '탄핵', 'ICE', 'FBI 수색', '부정선거']
-        hit_count = 0
-        
-        base_url = "https://search.naver.com/search.naver?where=news&sort=1&query="
-        
-        for kw in keywords:
-            try:
-                res = requests.get(base_url + kw, headers=self.headers, timeout=3)
-                if res.status_code == 200:
-                    soup = BeautifulSoup(res.text, "html.parser")
-                    # 뉴스 리스트 아이템 개수 (최대 10개) 카운트
-                    # 'news_area'는 각 뉴스 아이템의 클래스
-                    items = soup.select("div.news_area")
-                    
-                    # 간단한 로직: 상위 10개 중 '1시간 이내' 기사가 몇 개인지 체크하면 좋으나
-                    # 여기서는 단순 검색 결과 노출 여부로 판단 (각 키워드 당 최대 1점)
-                    if items:
-                        hit_count += 1
-            except:
-                continue
+        since = datetime.now() - timedelta(hours=config.GPR_RECENT_HOURS)
+
+        def recent(keyword):
+            items = self.news.search(keyword) # 결과는 NewsSearch가 Pulse/정책 뉴스와 공유
+            if items is None:
+                return self.articles.recent(keyword, config.GPR_RECENT_HOURS) > 0
+            return any(item["time"] is not None and item["time"] >= since for item in items)
+
+        # 각 키워드 당 최대 1점
+        hit_count = sum(self._map(recent, keywords))
                 
         # Risk Level Logic
         risk_level = "Stable"
@@ -230,27 +350,25 @@ class Scout:
         """
         [V16.6] Pulse Layer: 뉴스 센티먼트 점수화
         - 위기 단어(2.0) vs 일반 단어(0.5) 가중치 합산
+        - [V16.34] 키워드별 점수 = 가중치 x (1 - e^-n), n = 기사 수의 지수 감쇠 합 (반감기 PULSE_HALF_LIFE_HOURS)
+          매 실행 처음 본 기사만 더하고 나머지는 저장된 상태를 감쇠 -> 뉴스 '속도'를 반영
+          키워드당 최대 가중치라 합계는 기존 0 ~ Σ가중치 척도 유지 (SNR 임계값 그대로)
         """
         print("  - [Plus] Pulse Score (News Sentiment) 계산 중...")
-        total_score = 0.0
-        details = []
-        
         keywords = config.CRISIS_KEYWORDS if hasattr(config, 'CRISIS_KEYWORDS') else {}
-        base_url = "https://search.naver.com/search.naver?where=news&sort=1&query="
-        
-        for kw, weight in keywords.items():
-            try:
-                # 단순 검색 노출 여부 확인 (빠른 속도를 위해 timeout 짧게)
-                res = requests.get(base_url + kw, headers=self.headers, timeout=2)
-                if res.status_code == 200:
-                    soup = BeautifulSoup(res.text, "html.parser")
-                    if soup.select("div.news_area"):
-                        total_score += weight
-                        details.append(kw)
-            except:
-                 continue
-                 
-        return {"score": total_score, "matches": ", ".join(details[:5])} # 상위 5개만 표기
+
+        now = datetime.now()
+        fresh = dict(zip(keywords, self._map(self.news.fresh, keywords)))
+        scores, state = self.articles.pulse(keywords, fresh, now)
+        self._pulse_pending = (fresh, state, now) # 저장은 collect_data에서 채택 여부 확인 후
+        details = [kw for kw, score in sorted(scores.items(), key=lambda x: -x[1]) if score >= config.PULSE_MIN_SCORE]
+        # 새 기사 수는 매 실행 바뀌므로 로그로만 (Brain 스냅샷에 넣으면 '변화 없음' 재사용이 무력화됨)
+        print(f"    📰 새 기사 {sum(len(items) for items in fresh.values())}건")
+
+        return {
+            "score": round(sum(scores.values()), 2),
+            "matches": ", ".join(details[:5]), # 상위 5개만 표기
+        }
 
     # -------------------------------------------------------------------------
     # 기존 메소드들 (get_macro_data 등) 유지...
@@ -259,7 +377,7 @@ class Scout:
         [공공데이터포털] 국내 지수 시세 (KOSPI, KOSDAQ)
         """
         print("  - [Plus] 국내 지수(KOSPI/KOSDAQ) 확인 중...")
-        data = {"KOSPI": {"price": "0", "change": "0"}, "KOSDAQ": {"price": "0", "change": "0"}}
+        data = {"KOSPI": Quote(), "KOSDAQ": Quote()}
         
         api_key = config.DATA_GO_KR_API_KEY
         if not api_key:
@@ -274,11 +392,8 @@ class Scout:
         # numOfRows=10 & resultType=json으로 최근 데이터가 상위에 오는지 확인 필요.
         # 공공데이터포털은 보통 basDt를 지정해야 함. 어제 날짜로 시도.
         
-        target_date = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
-        if datetime.now().weekday() == 0: # 월요일이면 금요일 데이터
-            target_date = (datetime.now() - timedelta(days=3)).strftime("%Y%m%d")
-        elif datetime.now().weekday() == 6: # 일요일이면 금요일
-            target_date = (datetime.now() - timedelta(days=2)).strftime("%Y%m%d")
+        # [V16.33] 장 마감까지 끝난 마지막 KRX 영업일 (KST 기준, 주말/공휴일/임시휴장 건너뜀)
+        target_date = get_calendar("KRX").last_completed().strftime("%Y%m%d")
 
         params = {
             "serviceKey": api_key,
@@ -288,7 +403,7 @@ class Scout:
         }
         
         try:
-            res = requests.get(base_url, params=params, timeout=5)
+            res = transport.get(base_url, params=params)
             if res.status_code == 200:
                 try:
                     items = res.json().get("response", {}).get("body", {}).get("items", {}).get("item", [])
@@ -298,11 +413,11 @@ class Scout:
                         flt = item.get("fltRt") # 등락률
                         
                         if name == "코스피":
-                            data["KOSPI"] = {"price": price, "change": flt, "date": item.get("basDt")}
+                            data["KOSPI"] = Quote(parse_number(price), parse_number(flt), item.get("basDt"))
                         elif name == "코스닥":
-                            data["KOSDAQ"] = {"price": price, "change": flt, "date": item.get("basDt")}
-                except:
-                    pass
+                            data["KOSDAQ"] = Quote(parse_number(price), parse_number(flt), item.get("basDt"))
+                except (ValueError, AttributeError): # JSON 아님 / 결과 없을 때 items가 빈 문자열
+                    print("    ⚠️ 지수 응답 해석 실패")
             elif res.status_code == 403:
                 print("    ⚠️ 공공데이터포털 접근 권한 없음 (활용신청 필요)")
         except Exception as e:
@@ -319,68 +434,27 @@ class Scout:
         """
         [수급 데이터 수집]
         네이버 크롤링 차단 시 대안: PyKRX (한국거래소 데이터) 사용
+        - [V16.32] 일별 순매수는 로컬 저장소(data/flows.py)에 쌓고 저장되지 않은 날만 조회
+          (보통 오늘 하루, 시장당 1회 요청) -> 이번주/지난주 합계는 로컬 계산
         """
         try:
-            today = datetime.now()
-            today_str = today.strftime("%Y%m%d")
-            
-            # 요일 계산 (0:월 ~ 6:일)
-            idx = today.weekday()
-            
-            # 날짜 범위 설정 (YYYYMMDD 포맷)
-            # 1. 이번주 (월요일 ~ 오늘)
-            this_week_start_dt = today - timedelta(days=idx)
-            this_week_start = this_week_start_dt.strftime("%Y%m%d")
-            this_week_end = today_str
-            
-            # 2. 지난주 (지난주 월 ~ 지난주 금)
-            last_week_end_dt = this_week_start_dt - timedelta(days=3) # 지난주 금요일 (월-3일)
-            last_week_start_dt = last_week_end_dt - timedelta(days=4) # 지난주 월요일 (금-4일)
-            
-            last_week_start = last_week_start_dt.strftime("%Y%m%d")
-            last_week_end = last_week_end_dt.strftime("%Y%m%d")
+            krx = get_calendar("KRX") # 기준 시각은 KST (러너 시계가 UTC여도 같은 주차)
+
+            # 이번 주 경과 영업일 수 (휴장일 제외)
+            this_week = krx.week(0)
+            d_day = len(krx.between(*this_week)) if this_week else 0
 
-            # KRX에서 기간별 투자자 순매수 데이터 조회 (코스피 전체)
-            # IP 차단 등으로 데이터가 비어있을 경우 대비
+            # IP 차단 등으로 조회가 실패해도 이미 저장된 날짜로 집계
             try:
-                from pykrx import stock
-                df_this = stock.get_market_trading_value_by_date(this_week_start, this_week_end, "KOSPI")
-                df_last = stock.get_market_trading_value_by_date(last_week_start, last_week_end, "KOSPI")
+                self.flows.refresh()
             except Exception as e:
-                print(f"    ⚠️ PyKRX 접속 실패: {e}")
-                df_this = pd.DataFrame()
-                df_last = pd.DataFrame()
-
-            # 데이터가 비어있을 경우 (장 시작 전 또는 차단됨) 0으로 처리
-            if df_this.empty:
-                this_foreign = 0
-                this_inst = 0
-                this_ant = 0
-            else:
-                try:
-                    # 억 원 단위로 변환
-                    this_foreign = int(df_this['외국인'].sum() / 100000000)
-                    this_inst = int(df_this['기관합계'].sum() / 100000000)
-                    this_ant = int(df_this['개인'].sum() / 100000000)
-                except:
-                    this_foreign = 0; this_inst = 0; this_ant = 0
-
-            if df_last.empty:
-                last_foreign = 0
-                last_inst = 0
-                last_ant = 0
-            else:
-                try:
-                    last_foreign = int(df_last['외국인'].sum() / 100000000)
-                    last_inst = int(df_last['기관합계'].sum() / 100000000)
-                    last_ant = int(df_last['개인'].sum() / 100000000)
-                except:
-                    last_foreign = 0; last_inst = 0; last_ant = 0
+                print(f"    ⚠️ PyKRX 접속 실패 (저장된 수급으로 집계): {e}")
 
+            # 1. 이번주 (월요일 ~ 오늘) / 2. 지난주 (지난주 월 ~ 지난주 금), 억 원 단위
             return {
-                "this_week": {'foreign': this_foreign, 'inst': this_inst, 'ant': this_ant},
-                "last_week": {'foreign': last_foreign, 'inst': last_inst, 'ant': last_ant},
-                "d_day": idx + 1
+                "this_week": self.flows.week(0),
+                "last_week": self.flows.week(1),
+                "d_day": d_day
             }
 
         except Exception as e:
@@ -392,6 +466,27 @@ class Scout:
                 "error": str(e)
             }
 
+    def get_disclosures(self):
+        """
+        [V16.35] 감시 종목 주요 공시 (data/disclosures.py)
+        - 워터마크 이후 새 공시만 조회/저장, 결과는 최근 DISCLOSURE_LOOKBACK_DAYS일 주요 공시 (최신순)
+        - 조회 실패 시 저장된 공시로 계속 진행
+        """
+        print("  - [Plus] DART 공시 확인 중...")
+        try:
+            self.disclosures.poll()
+        except Exception as e:
+            print(f"    ⚠️ DART 조회 실패 (저장된 공시 사용): {e}")
+        return self.disclosures.recent()[:config.DISCLOSURE_TOP_N]
+
+    def get_universe_picks(self):
+        """
+        [V16.31] KOSPI/KOSDAQ 전 종목 수급 점수 스캔 (engines/universe.py)
+        """
+        print("  - [Plus] 전 종목 수급 스캔 중...")
+        from engines import universe
+        return universe.scan()
+
     def get_policy_news(self):
         """
         임무 3: 정책 및 지정학 뉴스 감청
@@ -400,24 +495,11 @@ class Scout:
         news_report = {}
         
         keywords = config.NEWS_KEYWORDS if hasattr(config, 'NEWS_KEYWORDS') else []
-        base_url = "https://search.naver.com/search.naver?where=news&sort=1&query="
-        
-        for keyword in keywords:
-            try:
-                url = base_url + keyword
-                res = requests.get(url, headers=self.headers)
-                soup = BeautifulSoup(res.text, "html.parser")
-                
-                # 뉴스 리스트 첫 번째 아이템
-                news_item = soup.select_one("div.news_area")
-                if news_item:
-                    title_tag = news_item.select_one("a.news_tit")
-                    if title_tag:
-                        title = title_tag.get_text()
-                        link = title_tag['href']
-                        news_report[keyword] = {"title": title, "link": link}
-            except Exception:
-                continue
+
+        # 뉴스 리스트 첫 번째 아이템
+        for keyword, item in zip(keywords, self._map(self.news.headline, keywords)):
+            if item:
+                news_report[keyword] = item
                 
         return news_report
 
@@ -428,34 +510,60 @@ class Scout:
         print("  - [4/4] 섹터별 정밀 분석 중...")
         micro_data = {}
 
+        # 시세는 배치 프레임에서, 재무 지표만 종목별 .info 조회
+        codes = list(dict.fromkeys(code for tickers in sectors.values() for code in tickers))
+        try:
+            quotes = self.prices.quotes(codes)
+        except Exception as e:
+            print(f"    ⚠️ 배치 시세 수집 실패: {e}")
+            quotes = pd.DataFrame(index=codes, columns=["price", "prev", "change"], dtype=float)
+
+        fields = ("grossMargins", "operatingMargins", "returnOnEquity")
+        with span("import", "yfinance"):
+            import yfinance as yf
+
+        def fetch_fundamentals(ticker_code):
+            try:
+                # 재무 지표는 분기 단위로만 변하므로 캐시 우선 (.info는 가장 느린 호출)
+                values = self.cache.get_many(ticker_code, fields)
+                if values is None:
+                    with health.guard("yfinance"), span("http", "yfinance:info", host="yfinance", ticker=ticker_code):
+                        info = yf.Ticker(ticker_code).info
+                    values = {field: info.get(field) for field in fields}
+                    # 빈/제한된 .info(값 있는 키가 없음)만 캐시하지 않음 -> 다음 실행에서 재조회
+                    # ETF/은행처럼 원래 없는 필드는 None 그대로 캐시 (매 실행 .info 재호출 방지)
+                    if info and any(value is not None for value in info.values()):
+                        self.cache.set_many(ticker_code, values)
+                # 핵심 지표 (Buffett/Munger style), 없는 필드는 None (출력 시 N/A)
+                ratio = lambda field: None if values[field] is None else float(values[field])
+                return {
+                    "gpm": ratio('grossMargins'),
+                    "opm": ratio('operatingMargins'),
+                    "roe": ratio('returnOnEquity'),
+                }
+            except Exception:
+                return {}
+
+        priced = [code for code in codes if pd.notna(quotes.loc[code, "price"])]
+        fundamentals = dict(zip(priced, self._map(fetch_fundamentals, priced)))
+
+        at = now_stamp()
         for sector, tickers in sectors.items():
             sector_data = {}
             for ticker_code, name in tickers.items():
-                try:
-                    t = yf.Ticker(ticker_code)
-                    info = t.info
-                    
-                    price = info.get('currentPrice', 0)
-                    prev_close = info.get('previousClose', price)
-                    change_rate = ((price - prev_close) / prev_close) * 100 if prev_close else 0
-                    
-                    # 핵심 지표 (Buffett/Munger style)
-                    gpm = info.get('grossMargins', 0) * 100 # GPM
-                    opm = info.get('operatingMargins', 0) * 100 # OPM
-                    roe = info.get('returnOnEquity', 0) * 100 # ROE
-                    
-                    sector_data[name] = {
-                        "price": f"{price:,.0f}" if "KS" in ticker_code or "KQ" in ticker_code else f"${price:.2f}",
-                        "change": f"{change_rate:+.2f}%",
-                        "GPM": f"{gpm:.1f}%",
-                        "OPM": f"{opm:.1f}%",
-                        "ROE": f"{roe:.1f}%"
-                    }
-                except Exception as e:
-                    # yfinance info 누락 시 대비 단순 계산 시도
-                    # (여기서는 에러 로깅 후 패스)
-                    # print(f"    ⚠️ {name} 수집 실패: {e}")
-                    sector_data[name] = "Data Unavailable"
+                if ticker_code not in fundamentals:
+                    # 시세 누락 종목 (출력 시 'Data Unavailable')
+                    sector_data[name] = None
+                    continue
+
+                change_rate = quotes.loc[ticker_code, "change"]
+                sector_data[name] = StockSnapshot(
+                    ticker_code,
+                    price=float(quotes.loc[ticker_code, "price"]),
+                    change=float(change_rate) if pd.notna(change_rate) else 0.0,
+                    at=at,
+                    **fundamentals[ticker_code]
+                )
             
             micro_data[sector] = sector_data
             
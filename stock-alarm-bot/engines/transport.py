@@ -0,0 +1,112 @@
+import re
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import config
+from engines import health
+from engines.profiler import span
+
+
+class Transport:
+    """
+    [V16.15] 공용 HTTP 전송 계층
+    - 호스트별 keep-alive 세션 풀 (TCP/TLS 핸드셰이크 재사용)
+    - 호스트별 동시 요청 상한 (네이버 등 차단 방지)
+    - 백오프 재시도 + 일관된 connect/read timeout (한 요청이 전체 실행을 멈추지 않도록)
+    - [V16.36] HEALTH_HOSTS 호스트는 소스 상태/차단기(engines/health.py)를 거침
+      (5xx/예외 = 실패, 4xx는 요청 단위 오류라 제외 - HEALTH_FAIL_STATUS에 지정한 소스만 예외)
+    """
+    def __init__(self, timeout=None, retries=None, backoff=None, host_limits=None, default_host_limit=None):
+        self.timeout = timeout or getattr(config, 'HTTP_TIMEOUT', (3.05, 10))
+        self.retries = retries if retries is not None else getattr(config, 'HTTP_RETRIES', 2)
+        self.backoff = backoff if backoff is not None else getattr(config, 'HTTP_BACKOFF', 0.5)
+        self.host_limits = host_limits or getattr(config, 'HTTP_HOST_LIMITS', {})
+        self.default_host_limit = default_host_limit or getattr(config, 'HTTP_DEFAULT_HOST_LIMIT', 8)
+
+        self._lock = threading.Lock()
+        self._sessions = {}   # host -> requests.Session
+        self._semaphores = {} # host -> BoundedSemaphore
+
+    def _retry_policy(self):
+        # 읽기/상태코드 재시도는 멱등 메소드(GET/HEAD)만, 연결 실패는 메소드 무관 재시도
+        return Retry(
+            total=self.retries,
+            connect=self.retries,
+            read=self.retries,
+            status=self.retries,
+            backoff_factor=self.backoff,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+
+    def _host_state(self, host):
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                limit = self.host_limits.get(host, self.default_host_limit)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=limit, max_retries=self._retry_policy())
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+                self._semaphores[host] = threading.BoundedSemaphore(limit)
+            return session, self._semaphores[host]
+
+    def request(self, method, url, **kwargs):
+        """requests.request와 동일한 시그니처 (timeout 미지정 시 기본값 적용)"""
+        kwargs.setdefault("timeout", self.timeout)
+        parts = urlsplit(url)
+        session, semaphore = self._host_state(parts.netloc)
+        # span 이름에는 쿼리(API 키)와 텔레그램 봇 토큰을 남기지 않음
+        path = re.sub(r"/bot[^/]+/", "/bot***/", parts.path)
+        source = health.get_registry().source_for(parts.netloc)
+        with health.guard(source) as call, span("http", f"{method} {parts.netloc}{path}", host=parts.netloc) as rec:
+            with semaphore:
+                response = session.request(method, url, **kwargs)
+            rec["status"] = response.status_code
+            if response.status_code >= 500 or response.status_code in config.HEALTH_FAIL_STATUS.get(source, ()):
+                call.fail(f"HTTP {response.status_code}")
+            rec["bytes"] = len(response.content)
+            retries = getattr(response.raw, "retries", None)
+            rec["retries"] = len(retries.history) if retries is not None else 0
+            return response
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions = {}
+            self._semaphores = {}
+
+
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport():
+    """프로세스 공용 Transport 싱글톤"""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = Transport()
+        return _transport
+
+
+def get(url, **kwargs):
+    return get_transport().get(url, **kwargs)
+
+
+def post(url, **kwargs):
+    return get_transport().post(url, **kwargs)
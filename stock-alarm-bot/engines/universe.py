@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+import config
+from data.portfolio import BUY_THRESHOLD
+from data.sessions import get_calendar
+from data.snapshot import ScanHit, now_stamp
+from engines import health
+from engines.profiler import span
+
+# 투자자 구분 (pykrx 표기) -> 점수 항목
+INVESTORS = {"foreign": "외국인", "inst": "기관합계"}
+EOK = 100_000_000 # 억 원
+
+
+def latest_trading_day(now=None):
+    """가장 최근 KRX 영업일 (YYYYMMDD, 장 시작 후면 오늘 포함) - [V16.33] 로컬 달력, 요청 없음"""
+    return get_calendar("KRX").last_started(now).strftime("%Y%m%d")
+
+
+def fetch_market(date, market):
+    """
+    한 시장의 전 종목 일봉 + 투자자별 순매수 (종목별 호출 없이 날짜 단위 일괄 조회 3회)
+    - 반환: 티커 인덱스, [name, close, change, value, foreign, inst] (순매수/거래대금은 억 원)
+    """
+    from pykrx import stock
+    with health.guard("krx") as call, span("http", f"krx:ohlcv_by_ticker:{market}", host="krx"):
+        ohlcv = stock.get_market_ohlcv_by_ticker(date, market=market)
+        if ohlcv.empty:
+            call.fail("empty ohlcv") # 영업일 전 종목 시세가 비면 차단/장애
+    frame = pd.DataFrame({
+        "close": ohlcv["종가"],
+        "change": ohlcv["등락률"],
+        "value": ohlcv["거래대금"] / EOK,
+    })
+    for key, investor in INVESTORS.items():
+        with health.guard("krx"), span("http", f"krx:net_purchases:{market}:{key}", host="krx"):
+            flows = stock.get_market_net_purchases_of_equities_by_ticker(date, date, market, investor)
+        frame[key] = (flows["순매수거래대금"] / EOK).reindex(frame.index).fillna(0.0)
+        if "name" not in frame:
+            frame["name"] = flows["종목명"].reindex(frame.index)
+    frame["market"] = market
+    return frame
+
+
+def fetch_universe(date=None, markets=None):
+    """KOSPI/KOSDAQ 전 종목 프레임 (시장별 병렬 조회)"""
+    date = date or latest_trading_day()
+    markets = markets or config.UNIVERSE_MARKETS
+    with span("import", "pykrx"):
+        import pykrx # noqa: F401 (첫 import 비용을 별도 기록)
+    with ThreadPoolExecutor(max_workers=len(markets), thread_name_prefix="universe") as pool:
+        frames = list(pool.map(lambda market: fetch_market(date, market), markets))
+    universe = pd.concat(frames)
+    universe.attrs["date"] = date
+    return universe
+
+
+def score_universe(universe, weights=None, min_value=None):
+    """
+    README 수급 점수 (벡터 연산): 외국인 순매수 +40 / 기관 순매수 +30 / 주가 상승 +30
+    - 거래대금 min_value(억 원) 미만 / 거래정지(거래대금 0) 종목은 제외
+    """
+    weights = weights or config.UNIVERSE_WEIGHTS
+    min_value = config.UNIVERSE_MIN_VALUE if min_value is None else min_value
+    frame = universe[(universe["value"] > 0) & (universe["value"] >= min_value)].copy()
+    frame["score"] = (
+        weights["foreign"] * (frame["foreign"].to_numpy() > 0)
+        + weights["inst"] * (frame["inst"].to_numpy() > 0)
+        + weights["price"] * (frame["change"].to_numpy() > 0)
+    )
+    frame["flow"] = frame["foreign"] + frame["inst"]
+    return frame
+
+
+def top_picks(scored, threshold=None, top_n=None):
+    """threshold(BUY_THRESHOLD) 이상 종목 중 점수 -> 외국인+기관 순매수 금액 순 상위 N개"""
+    threshold = BUY_THRESHOLD if threshold is None else threshold
+    top_n = top_n or config.UNIVERSE_TOP_N
+    picks = scored[scored["score"] >= threshold]
+    return picks.sort_values(["score", "flow"], ascending=False).head(top_n)
+
+
+def scan(date=None, top_n=None):
+    """
+    [V16.31] 전 종목 스캔 -> 매수 기준 이상 상위 N개 [ScanHit, ...]
+    """
+    universe = fetch_universe(date)
+    scored = score_universe(universe)
+    picks = top_picks(scored, top_n=top_n)
+    at = now_stamp()
+    print(f"    🔭 Universe: {len(universe)}종목 중 {int((scored['score'] >= BUY_THRESHOLD).sum())}개가 {BUY_THRESHOLD}점 이상 ({universe.attrs['date']})")
+    return [
+        ScanHit(
+            code=code, name=row["name"], market=row["market"], price=float(row["close"]),
+            change=float(row["change"]), foreign=float(row["foreign"]), inst=float(row["inst"]),
+            score=int(row["score"]), at=at,
+        )
+        for code, row in picks.iterrows()
+    ]
+
+
+if __name__ == "__main__":
+    # 단독 실행: python -m engines.universe [YYYYMMDD]
+    import sys
+    for hit in scan(sys.argv[1] if len(sys.argv) > 1 else None):
+        print(hit.render())
@@ -1,11 +1,17 @@
+import time
+_STARTED = time.perf_counter() # [V16.24] 기동 시간 측정 기준점
+
 import os
 import sys
 import datetime
 import pytz
 import config
-from engines.scout import Scout
-from engines.brain import Brain
-from notifiers.telegram_bot import send_message
+# [V16.24] Scout(pandas/yfinance/pykrx/bs4)와 Brain(google.generativeai)은 무거우므로
+# 실제로 리포트를 만들 때 import (heartbeat/진단은 1초 이내 전송)
+from notifiers.telegram_bot import SectionStream, send_message
+from engines.profiler import profiler, span
+from engines import health
+from engines.deadline import Deadline, TimeoutError, run_with_timeout
 
 def get_report_by_time():
     """
@@ -25,11 +31,16 @@ logging.basicConfig(
     ]
 )
 
+# 실행 프로파일 (bot.log 옆에 JSON으로 저장)
+PROFILE_PATH = "run_profile.json"
+
 
 def _generate_basic_report(market_data):
     """
     AI 분석 실패 시 제공되는 기본 데이터 리포트 생성기
     """
+    from data.snapshot import render
+    market_data = render(market_data) # 숫자/레코드 -> 표시 문자열
     report = "🔌 **[데이터 수집 리포트]** (AI 미연동 - V16.0)\n\n"
     report += "```\n"
     
@@ -63,41 +74,147 @@ def _generate_basic_report(market_data):
                     report += f"  {name}: {price} ({change})\n"
                 else:
                     report += f"  {name}: {data}\n"
+    # 5. Universe (전 종목 스캔 상위)
+    picks = market_data.get('universe', [])
+    if picks:
+        report += "\n[Universe Top Picks]\n"
+        for pick in picks:
+            report += f"- {pick}\n"
+    # 6. Disclosures (감시 종목 주요 공시)
+    disclosures = market_data.get('disclosures', [])
+    if disclosures:
+        report += "\n[DART Disclosures]\n"
+        for item in disclosures:
+            report += f"- {item}\n"
+    # 7. Stale (마감 초과로 이전 값 사용)
+    stale = market_data.get('stale', {})
+    if stale:
+        report += "\n[Stale - 이전 수집 값]\n"
+        for mission, at in stale.items():
+            report += f"- {mission}: {at}\n"
     report += "```"
     return report
 
-def get_report_by_time():
+def _run_deadline():
+    """
+    [V16.22] 실행 마감: 총 예산(RUN_DEADLINE_SEC)과 전송 마감 시각(REPORT_SEND_BY, KST) 중 이른 쪽
+    - 이미 마감 시각을 지난 실행(수동 실행 등)은 총 예산만 적용
+    """
+    budget = config.RUN_DEADLINE_SEC
+    if config.REPORT_SEND_BY:
+        now = datetime.datetime.now(pytz.timezone('Asia/Seoul'))
+        hour, minute = map(int, config.REPORT_SEND_BY.split(":"))
+        send_by = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        left = (send_by - now).total_seconds()
+        if 0 < left < budget:
+            budget = left
+    return Deadline(budget)
+
+def get_report_slot(now=None):
+    """
+    현재 시각(KST)에 해당하는 리포트 시간대 이름 (config.REPORT_SLOTS)
+    """
+    now = now or datetime.datetime.now(pytz.timezone('Asia/Seoul'))
+    hhmm = now.strftime("%H:%M")
+    for start, end, title in config.REPORT_SLOTS:
+        if start <= hhmm < end:
+            return title
+    return config.REPORT_DEFAULT_SLOT
+
+def _new_scout():
+    with span("import", "engines.scout"):
+        from engines.scout import Scout
+    return Scout()
+
+def _init_brain():
+    """Brain 초기화 (실패 시 None -> 기본 리포트)"""
+    try:
+        with span("import", "engines.brain"):
+            from engines.brain import Brain
+        return Brain()
+    except Exception as e:
+        logging.error(f"⚠️ AI 초기화 실패 ({e}). 기본 리포트로 전환합니다.")
+        return None
+
+def get_report_by_time(scout=None, brain=None, stream=False):
     """
     시간대별 리포트 생성 로직
     - Scout: 데이터 수집 (전체 섹터 + 매크로)
     - Brain: 분석 및 글쓰기
+    - scout/brain을 넘기면 재사용 (daemon 모드: 캐시/커넥션 풀 유지)
+    - [V16.27] stream=True면 AI 분석을 섹션 단위로 바로 텔레그램 전송하고,
+      아직 전송되지 않은 나머지만 반환 (전부 전송됐으면 빈 문자열)
     """
     logging.info(f"🚀 Stock Alarm Bot 시작 (Time: {datetime.datetime.now()})")
+    run_deadline = _run_deadline()
+    slot = get_report_slot()
 
     # Scout와 Brain 초기화
-    scout = Scout()
-    
-    try:
-        brain = Brain()
-        ai_available = True
-    except Exception as e:
-        logging.error(f"⚠️ AI 초기화 실패 ({e}). 기본 리포트로 전환합니다.")
-        ai_available = False
+    scout = scout or _new_scout()
+    brain = brain or _init_brain()
+    ai_available = brain is not None
 
     # 1. 데이터 수집 (섹터 전체 + 매크로)
-    market_data = scout.collect_data(config.SECTORS, config.MACRO_TICKERS)
+    # 수집 예산은 Brain 분석 시간을 남겨두도록 총 마감의 절반을 넘지 않음
+    collect_deadline = Deadline(min(config.COLLECT_DEADLINE_SEC, run_deadline.remaining() / 2))
+    market_data = scout.collect_data(config.SECTORS, config.MACRO_TICKERS, deadline=collect_deadline)
+    market_data["report_slot"] = slot
     logging.info("데이터 수집 완료")
+    if market_data.get("stale"):
+        logging.warning(f"⏰ 마감 초과 임무 (이전 값 사용): {market_data['stale']}")
     
     # 2. 리포트 생성
+    header = f"🕐 **[{slot}]**\n\n"
+    sections = SectionStream(header) if stream and ai_available else None
     if ai_available:
         logging.info("🧠 Brain: AI 분석 시작...")
-        report = brain.analyze_market(market_data)
+        try:
+            report = run_with_timeout(lambda: brain.analyze_market(market_data, on_section=sections), run_deadline.remaining(), name="brain")
+        except TimeoutError:
+            # 마감 내 AI 분석 미완료 시에도 리포트는 반드시 전송
+            report = _generate_basic_report(market_data)
+            logging.warning("⏰ AI 분석 마감 초과로 기본 리포트 생성됨")
+        except Exception as e:
+            # 스트리밍 중 실패 (일부 섹션은 이미 전송됐을 수 있음) -> 에러 문구 대신 기본 리포트
+            report = _generate_basic_report(market_data)
+            logging.warning(f"AI 분석 실패로 기본 리포트 생성됨: {e}")
     else:
         # AI 사용 불가 시 간단 요약 (Fallback)
         report = _generate_basic_report(market_data)
         logging.warning("AI 분석 실패로 기본 리포트 생성됨")
 
-    return report
+    if sections is not None:
+        rest = sections.finish(report)
+        return f"{header}{rest}" if rest and not sections.delivered else rest
+    return f"{header}{report}"
+
+def deliver_report(scout=None, brain=None):
+    """
+    리포트 생성 -> 실행 소요 시간 요약 첨부 -> 텔레그램 전송 -> 실행 프로파일 저장
+    """
+    profiler.reset()
+    try:
+        final_report = get_report_by_time(scout, brain, stream=config.BRAIN_STREAMING)
+        # [Profile] 실행 소요 시간 한 줄 요약 (스트리밍으로 본문이 이미 전송됐으면 단독 전송)
+        timing = profiler.summary_line()
+        logging.info(timing)
+        # [V16.36] 소스 상태 (차단/불안정 소스만 표기)
+        sources = health.get_registry().summary_line()
+        if sources:
+            logging.info(sources)
+            timing = f"{timing}\n{sources}"
+        final_report = f"{final_report}\n\n{timing}" if final_report else timing
+        logging.info("📨 텔레그램 전송 중...")
+        send_message(final_report)
+    finally:
+        try:
+            profiler.dump(PROFILE_PATH)
+        except Exception as e:
+            logging.warning(f"⚠️ 실행 프로파일 저장 실패: {e}")
+        try:
+            health.get_registry().save()
+        except Exception as e:
+            logging.warning(f"⚠️ 소스 상태 저장 실패: {e}")
 
 if __name__ == "__main__":
     try:
@@ -112,10 +229,13 @@ if __name__ == "__main__":
         # [Heartbeat] 생존 신고
         start_msg = f"🚀 **[System Start]** Stock Alarm Bot V16.11 가동 시작\n- Env: {'Cloud (GitHub)' if os.environ.get('GITHUB_ACTIONS') else 'Local'}\n- Time: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         send_message(start_msg)
+        logging.info(f"⚡ 기동 ~ Heartbeat 전송: {time.perf_counter() - _STARTED:.2f}s")
 
-        final_report = get_report_by_time()
-        logging.info("📨 텔레그램 전송 중...")
-        send_message(final_report)
+        # 진단 전용 실행: python main.py --diagnostics
+        if "--diagnostics" in sys.argv:
+            sys.exit(0)
+
+        deliver_report()
         logging.info("✅ 모든 작업 완료.")
         
     except Exception as e:
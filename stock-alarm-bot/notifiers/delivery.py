@@ -0,0 +1,216 @@
+import itertools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import config
+from engines import health, transport
+from engines.profiler import span
+
+TELEGRAM_LIMIT = 4096
+
+# 나누는 위치 우선순위: 섹션 머리(1️⃣ ...) > 빈 줄 > 줄바꿈 > 공백
+_BOUNDARIES = [
+    re.compile(r"\n(?=[ \t]*\**[ \t]*[0-9]\ufe0f?\u20e3)"),
+    re.compile(r"\n\s*\n"),
+    re.compile(r"\n"),
+    re.compile(r" "),
+]
+
+
+def split_message(text, limit=TELEGRAM_LIMIT):
+    """limit 이하 조각으로 분할 (가능한 한 섹션 경계에서)"""
+    chunks = []
+    while len(text) > limit:
+        cut = None
+        for boundary in _BOUNDARIES:
+            positions = [m.start() for m in boundary.finditer(text, 0, limit + 1) if m.start() > 0]
+            if positions:
+                cut = positions[-1]
+                break
+        cut = cut or limit
+        chunks.append(text[:cut].rstrip())
+        text = text[cut:].lstrip("\n")
+    if text.strip():
+        chunks.append(text)
+    return chunks
+
+
+class RateLimiter:
+    """최소 간격 기반 속도 제한 (호출 스레드를 필요한 만큼 대기)"""
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class DeliveryQueue:
+    """
+    [V16.28] 텔레그램 발송 큐
+    - 4096자 초과 메시지는 섹션 경계에서 분할
+    - 파일로 저장되는 대기열 (전송 전에 죽어도 다음 실행에서 이어서 전송)
+    - 채팅방별 순서 보장 + 채팅방 간 병렬 전송 (fan-out)
+    - 전역/채팅방별 속도 제한, 429는 retry_after만큼 대기, 일시 오류는 백오프 재시도
+    - 대기열에 넣은 지 TELEGRAM_MAX_AGE초가 지난 조각은 보내지 않고 폐기 (지난 실행의 리포트/알림이 뒤늦게 가지 않도록)
+    """
+    def __init__(self, path=None, chat_ids=None, post=None):
+        self.path = path or os.path.join(config.CACHE_DIR, "telegram_queue.json")
+        self.chat_ids = chat_ids or config.TELEGRAM_CHAT_IDS
+        self._post = post or self._telegram_post
+        self._lock = threading.Lock()
+        self._drain_lock = threading.Lock()
+        self._seq = itertools.count(int(time.time() * 1000))
+        self._global = RateLimiter(1 / config.TELEGRAM_GLOBAL_RATE)
+        self._chats = defaultdict(lambda: RateLimiter(config.TELEGRAM_CHAT_INTERVAL))
+        self.items = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return []
+
+    def _save(self):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.items, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+
+    def enqueue(self, text, chat_ids=None):
+        """메시지를 분할해 채팅방별로 대기열에 추가"""
+        chunks = split_message(text)
+        now = time.time()
+        with self._lock:
+            for chat_id in chat_ids or self.chat_ids:
+                for chunk in chunks:
+                    self.items.append({"id": next(self._seq), "chat_id": str(chat_id), "text": chunk,
+                                       "attempts": 0, "at": now})
+        self._save()
+
+    def _remove(self, item):
+        with self._lock:
+            self.items = [i for i in self.items if i["id"] != item["id"]]
+        self._save()
+
+    @staticmethod
+    def _telegram_post(chat_id, text, markdown=True):
+        url = f"https://api.telegram.org/bot{config.TELEGRAM_TOKEN}/sendMessage"
+        data = {"chat_id": chat_id, "text": text}
+        if markdown:
+            data["parse_mode"] = "Markdown" # 굵은 글씨 등 스타일 적용
+        return transport.post(url, data=data)
+
+    def _send(self, item, until):
+        """
+        한 조각 전송 (성공/영구 실패 시 True = 대기열에서 제거, 마감까지 못 보내면 False)
+        """
+        markdown = True
+        while time.monotonic() < until:
+            self._global.wait()
+            self._chats[item["chat_id"]].wait()
+            try:
+                with span("telegram", "send_message", chars=len(item["text"]), chat=item["chat_id"]) as rec:
+                    response = self._post(item["chat_id"], item["text"], markdown)
+                    rec["status"] = response.status_code
+            except health.CircuitOpen as e:
+                # 차단기 열림: 시도 횟수를 쓰지 않고 대기열에 남겨 다음 drain에서 재전송
+                logging.warning(f"⛔ 텔레그램 전송 보류 ({item['chat_id']}): {e}")
+                return False
+            except Exception as e:
+                response, error = None, str(e)
+
+            if response is not None and response.status_code == 200:
+                return True
+            if response is not None:
+                try:
+                    body = response.json()
+                except ValueError:
+                    body = {}
+                error = body.get("description", response.text)
+                if response.status_code == 429:
+                    # 속도 제한: 서버가 알려준 시간만큼 대기 (재시도 횟수에 포함하지 않음)
+                    retry_after = body.get("parameters", {}).get("retry_after", 1)
+                    logging.warning(f"⏳ 텔레그램 속도 제한 ({item['chat_id']}): {retry_after}s 대기")
+                    time.sleep(min(retry_after, max(until - time.monotonic(), 0)))
+                    continue
+                if response.status_code == 400 and markdown and "parse" in error:
+                    # 분할 등으로 Markdown이 깨진 경우 일반 텍스트로 재전송
+                    markdown = False
+                    continue
+                if 400 <= response.status_code < 500:
+                    logging.error(f"❌ 텔레그램 전송 실패 ({item['chat_id']}): {error}")
+                    return True
+
+            item["attempts"] += 1
+            if item["attempts"] >= config.TELEGRAM_MAX_ATTEMPTS:
+                logging.error(f"❌ 텔레그램 전송 포기 ({item['chat_id']}, {item['attempts']}회): {error}")
+                return True
+            time.sleep(min(config.TELEGRAM_BACKOFF * 2 ** (item["attempts"] - 1), max(until - time.monotonic(), 0)))
+        return False
+
+    def _drain_chat(self, items, until):
+        for item in items:
+            if not self._send(item, until):
+                return # 채팅방 내 순서 유지: 앞 조각이 남으면 뒤 조각도 다음 drain으로
+            self._remove(item)
+
+    def expire(self, now=None):
+        """TELEGRAM_MAX_AGE 초과 조각 폐기 -> 폐기 수 (at이 없는 예전 항목은 id(ms 시각)로 판단)"""
+        cutoff = (now or time.time()) - config.TELEGRAM_MAX_AGE
+        with self._lock:
+            expired = [i for i in self.items if i.get("at", i["id"] / 1000) < cutoff]
+            if not expired:
+                return 0
+            dropped = {i["id"] for i in expired}
+            self.items = [i for i in self.items if i["id"] not in dropped]
+        for chat_id in sorted({i["chat_id"] for i in expired}):
+            count = sum(1 for i in expired if i["chat_id"] == chat_id)
+            logging.warning(f"🗑️ 텔레그램 만료 조각 폐기 ({chat_id}): {count}건 ({config.TELEGRAM_MAX_AGE}s 초과)")
+        self._save()
+        return len(expired)
+
+    def drain(self, timeout=None):
+        """대기열 전송 (채팅방 간 병렬). 반환: 남은 조각 수"""
+        until = time.monotonic() + (timeout or config.TELEGRAM_DRAIN_TIMEOUT)
+        with self._drain_lock:
+            self.expire()
+            with self._lock:
+                by_chat = defaultdict(list)
+                for item in sorted(self.items, key=lambda i: i["id"]):
+                    by_chat[item["chat_id"]].append(item)
+            if not by_chat:
+                return 0
+            workers = min(len(by_chat), config.TELEGRAM_MAX_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="telegram") as pool:
+                list(pool.map(lambda chat_items: self._drain_chat(chat_items, until), by_chat.values()))
+            with self._lock:
+                return len(self.items)
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_queue():
+    """프로세스 공용 발송 큐 싱글톤"""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = DeliveryQueue()
+        return _queue
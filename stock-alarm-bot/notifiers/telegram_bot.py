@@ -1,30 +1,58 @@
-import requests
-import config
+import threading
 
-def send_message(message):
+from notifiers.delivery import get_queue
+
+def send_message(message, chat_ids=None):
     """
     텔레그램으로 메시지를 발송하는 함수
+    - [V16.28] 발송 큐 경유: 4096자 분할, 속도 제한/재시도, TELEGRAM_CHAT_IDS 전체로 동시 전송
+    - 마감(TELEGRAM_DRAIN_TIMEOUT)까지 못 보낸 조각은 큐 파일에 남아 다음 전송 때 이어서 발송
     """
     try:
-        token = config.TELEGRAM_TOKEN
-        chat_id = config.TELEGRAM_CHAT_ID
-        
         # 메시지가 없으면 발송 취소
         if not message:
             return
 
-        url = f"https://api.telegram.org/bot{token}/sendMessage"
-        data = {
-            "chat_id": chat_id,
-            "text": message,
-            "parse_mode": "Markdown"  # 굵은 글씨 등 스타일 적용
-        }
-        
-        response = requests.post(url, data=data)
+        queue = get_queue()
+        queue.enqueue(message, chat_ids)
+        remaining = queue.drain()
         
         # 전송 실패 시 로그 출력
-        if response.status_code != 200:
-            print(f"❌ 텔레그램 전송 실패: {response.text}")
+        if remaining:
+            print(f"❌ 텔레그램 전송 지연: {remaining}개 조각이 대기열에 남음")
             
     except Exception as e:
-        print(f"❌ 텔레그램 에러: {e}")
\ No newline at end of file
+        print(f"❌ 텔레그램 에러: {e}")
+
+
+class SectionStream:
+    """
+    [V16.27] 리포트를 섹션 단위로 순차 전송 (Brain 스트리밍 on_section 콜백)
+    - 첫 섹션에는 header(시간대 표기)를 붙임
+    - finish() 이후 도착하는 섹션(마감 초과로 버려진 분석)은 전송하지 않음
+    """
+    def __init__(self, header="", send=None):
+        self.header = header
+        self.send = send or send_message
+        self.delivered = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def __call__(self, section):
+        with self._lock:
+            if self._closed:
+                return
+            text = f"{self.header}{section}" if not self.delivered else section
+            self.send(text)
+            self.delivered.append(section)
+
+    def finish(self, report):
+        """스트림 종료 -> 아직 전송되지 않은 나머지 (전부 스트리밍됐으면 빈 문자열)"""
+        with self._lock:
+            self._closed = True
+            if not self.delivered:
+                return report
+            if all(section in report for section in self.delivered):
+                return ""
+            # 일부 섹션만 전송된 뒤 기본 리포트로 대체된 경우
+            return f"⚠️ AI 분석이 중간에 끊겨 기본 리포트를 이어서 보냅니다.\n\n{report}"